@@ -0,0 +1,8 @@
+"""
+Python version compatibility helpers.
+"""
+from __future__ import annotations
+import sys
+
+# dataclass(slots=True) needs Python 3.10+; spread into @dataclass(...)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -6,10 +6,16 @@ corruption from concurrent access or crashes mid-write.
 """
 
 import os
+import json
 import time
 import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encoding/decoding
+    orjson = None
 
 
 def atomic_write(path: Path, content: str, encoding: str = 'utf-8') -> None:
@@ -49,6 +55,22 @@ def atomic_write(path: Path, content: str, encoding: str = 'utf-8') -> None:
         raise
 
 
+def dumps_json(data: Any) -> str:
+    """
+    Serialize data to indented JSON.
+
+    Uses orjson when installed, falling back to the stdlib json module.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
+
+
+def atomic_write_json(path: Path, data: Any) -> None:
+    """Atomically write data as indented JSON (see atomic_write)."""
+    atomic_write(path, dumps_json(data))
+
+
 class FileLock:
     """
     Simple file-based lock for registry operations.
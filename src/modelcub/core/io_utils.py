@@ -1,7 +1,13 @@
 from __future__ import annotations
-import hashlib, shutil, sys, tarfile, urllib.request, zipfile
+import atexit, hashlib, os, shutil, sys, tarfile, threading, urllib.request, uuid, zipfile
 from pathlib import Path
 
+# Background deletes still running, joined at exit (see _join_pending_deletes)
+_PENDING_DELETES: set = set()
+_PENDING_LOCK = threading.Lock()
+# Trash directories already swept by this process (see sweep_trash)
+_SWEPT_TRASH: set = set()
+
 def sha256_file(path: Path) -> str:
     h = hashlib.sha256()
     with path.open("rb") as f:
@@ -44,3 +50,58 @@ def copy_tree(src: Path, dst: Path) -> None:
 def delete_tree(path: Path) -> None:
     if path.exists():
         shutil.rmtree(path, ignore_errors=True)
+
+def _rmtree_tracked(path: Path) -> None:
+    try:
+        shutil.rmtree(path, ignore_errors=True)
+    finally:
+        with _PENDING_LOCK:
+            _PENDING_DELETES.discard(threading.current_thread())
+
+def _start_background_rmtree(path: Path) -> None:
+    thread = threading.Thread(target=_rmtree_tracked, args=(path,), daemon=True)
+    with _PENDING_LOCK:
+        _PENDING_DELETES.add(thread)
+    thread.start()
+
+def _join_pending_deletes() -> None:
+    """Wait for background deletes before the interpreter kills daemon threads."""
+    with _PENDING_LOCK:
+        threads = list(_PENDING_DELETES)
+    for thread in threads:
+        thread.join()
+
+atexit.register(_join_pending_deletes)
+
+def delete_tree_in_background(path: Path, trash_dir: Path) -> None:
+    """Move path into trash_dir and delete trash_dir on a background thread.
+
+    The rename is atomic, so path is gone when this returns; leftovers from
+    an interrupted earlier delete are reaped along with it. The process
+    waits for pending deletes at exit. Falls back to a synchronous delete if
+    the rename fails (e.g. across filesystems).
+    """
+    if not path.exists():
+        return
+    trash_dir.mkdir(parents=True, exist_ok=True)
+    staged = trash_dir / f"{path.name}-{uuid.uuid4().hex[:8]}"
+    try:
+        os.rename(path, staged)
+    except OSError:
+        delete_tree(path)
+        return
+    _start_background_rmtree(trash_dir)
+
+def sweep_trash(trash_dir: Path) -> None:
+    """Reap anything left in trash_dir (e.g. by a killed process), once per process."""
+    key = os.fspath(trash_dir)
+    if key in _SWEPT_TRASH:
+        return
+    _SWEPT_TRASH.add(key)
+    try:
+        with os.scandir(trash_dir) as it:
+            if next(it, None) is None:
+                return
+    except (FileNotFoundError, NotADirectoryError):
+        return
+    _start_background_rmtree(trash_dir)
@@ -4,6 +4,8 @@ Path resolution for ModelCub projects.
 Updated to work with new .modelcub/ architecture.
 """
 from __future__ import annotations
+from functools import lru_cache
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -11,6 +13,15 @@ from typing import Optional
 CACHE_DIR = (Path.home() / ".cache" / "modelcub" / "datasets").resolve()
 
 
+# Discovered project roots keyed by the raw cwd string (positive hits only)
+_PROJECT_ROOTS: dict[str, Path] = {}
+
+
+def _is_project_root(p: Path) -> bool:
+    """Check for .modelcub/ (new architecture) or modelcub.yaml (legacy)."""
+    return (p / ".modelcub").is_dir() or (p / "modelcub.yaml").exists()
+
+
 def project_root() -> Path:
     """
     Find the project root by looking for .modelcub/ or modelcub.yaml.
@@ -18,21 +29,54 @@ def project_root() -> Path:
     Walks up from CWD to find a directory containing:
     - .modelcub/ (new architecture)
     - modelcub.yaml (legacy fallback)
+
+    Found roots are cached per working directory and re-validated with a
+    single check, so repeated calls skip the upward walk. Misses are not
+    cached, so a project created later is still picked up.
     """
-    here = Path.cwd().resolve()
+    cwd = os.getcwd()
+    cached = _PROJECT_ROOTS.get(cwd)
+    if cached is not None and _is_project_root(cached):
+        return cached
+
+    here = Path(cwd).resolve()
 
     for p in [here] + list(here.parents):
         # Prefer new architecture
         if (p / ".modelcub").is_dir():
+            _PROJECT_ROOTS[cwd] = p
             return p
         # Fallback to legacy
         if (p / "modelcub.yaml").exists():
+            _PROJECT_ROOTS[cwd] = p
             return p
 
     # If not in a project, return CWD
     return here
 
 
+def clear_project_root_cache() -> None:
+    """Forget cached project roots (e.g. after creating or deleting a project)."""
+    _PROJECT_ROOTS.clear()
+
+
+@lru_cache(maxsize=32)
+def _resolve_cached(raw: str, cwd: str) -> Path:
+    return Path(raw).resolve()
+
+
+def resolve_path(path: str | Path) -> Path:
+    """
+    Path(path).resolve(), memoized per input.
+
+    resolve() costs an lstat() per path component; SDK objects resolve the
+    same project path over and over. Relative inputs are keyed on the
+    current directory as well, so a chdir() never returns a stale result.
+    """
+    raw = os.fspath(path)
+    return _resolve_cached(raw, "" if os.path.isabs(raw) else os.getcwd())
+
+
 def modelcub_dir() -> Path:
     """Get the .modelcub directory for the current project."""
     return project_root() / ".modelcub"
@@ -68,22 +112,43 @@ def backups_dir() -> Path:
     return modelcub_dir() / "backups"
 
 
+@lru_cache(maxsize=16)
+def _configured_paths(root: Path, config_mtime_ns: int) -> Optional[tuple[str, str, str]]:
+    """Parse (data, runs, reports) from config; cached per config file version."""
+    from .config import load_config
+    config = load_config(root)
+    if not config:
+        return None
+    return config.paths.data, config.paths.runs, config.paths.reports
+
+
+def _project_paths(root: Path) -> Optional[tuple[str, str, str]]:
+    """
+    Get configured (data, runs, reports) directories for a project.
+
+    Keyed on the config file's mtime so the YAML is only re-parsed when it
+    changes on disk.
+    """
+    try:
+        mtime_ns = (root / ".modelcub" / "config.yaml").stat().st_mtime_ns
+        return _configured_paths(root, mtime_ns)
+    except Exception:
+        return None
+
+
 def datasets_dir() -> Path:
     """
     Get path to datasets directory.
 
     Tries to load from config, falls back to data/datasets
     """
-    try:
-        from .config import load_config
-        config = load_config(project_root())
-        if config:
-            return project_root() / config.paths.data / "datasets"
-    except:
-        pass
+    root = project_root()
+    paths = _project_paths(root)
+    if paths:
+        return root / paths[0] / "datasets"
 
     # Fallback
-    return project_root() / "data" / "datasets"
+    return root / "data" / "datasets"
 
 
 def runs_dir() -> Path:
@@ -92,16 +157,13 @@ def runs_dir() -> Path:
 
     Tries to load from config, falls back to runs/
     """
-    try:
-        from .config import load_config
-        config = load_config(project_root())
-        if config:
-            return project_root() / config.paths.runs
-    except:
-        pass
+    root = project_root()
+    paths = _project_paths(root)
+    if paths:
+        return root / paths[1]
 
     # Fallback
-    return project_root() / "runs"
+    return root / "runs"
 
 
 def reports_dir() -> Path:
@@ -110,13 +172,10 @@ def reports_dir() -> Path:
 
     Tries to load from config, falls back to reports/
     """
-    try:
-        from .config import load_config
-        config = load_config(project_root())
-        if config:
-            return project_root() / config.paths.reports
-    except:
-        pass
+    root = project_root()
+    paths = _project_paths(root)
+    if paths:
+        return root / paths[2]
 
     # Fallback
-    return project_root() / "reports"
\ No newline at end of file
+    return root / "reports"
@@ -2,17 +2,29 @@
 ModelCub registries for datasets, training runs, and models.
 """
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Iterator
+import copy
+import os
 import yaml
 import json
 from datetime import datetime
 
+from modelcub.core.images import VALID_IMAGE_EXTENSIONS
 from modelcub.core.exceptions import (
     DatasetNotFoundError,
     ClassExistsError,
     ClassNotFoundError
 )
 
+# libyaml-backed loader is several times faster than the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _load_yaml(path: Path) -> Any:
+    """Safely parse a YAML file, using libyaml when available."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
 
 def initialize_registries(project_root: Path) -> None:
     """Initialize empty registry files for a new project.
@@ -55,19 +67,41 @@ class DatasetRegistry:
         self.project_root = Path(project_root)
         self.registry_path = self.project_root / ".modelcub" / "datasets.yaml"
         self.datasets_dir = self.project_root / "data" / "datasets"
+        # (registry file stat, datasets keyed by name); see _index()
+        self._index_cache: Optional[tuple] = None
 
     def _load_registry(self) -> Dict:
         """Load datasets registry from YAML."""
-        if not self.registry_path.exists():
+        try:
+            return _load_yaml(self.registry_path) or {"datasets": {}}
+        except FileNotFoundError:
             return {"datasets": {}}
-        with open(self.registry_path, 'r') as f:
-            return yaml.safe_load(f) or {"datasets": {}}
 
     def _save_registry(self, registry: Dict) -> None:
         """Save datasets registry to YAML."""
         self.registry_path.parent.mkdir(parents=True, exist_ok=True)
         with open(self.registry_path, 'w') as f:
             yaml.safe_dump(registry, f, default_flow_style=False, sort_keys=False)
+        self._index_cache = None
+
+    def _index(self) -> Dict[str, Dict[str, Any]]:
+        """Datasets keyed by name, re-parsed only when datasets.yaml changes.
+
+        The cache is keyed on the file's mtime and size, so writes from other
+        processes invalidate it; this instance's own writes reset it directly.
+        """
+        try:
+            st = os.stat(self.registry_path)
+            stamp = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            stamp = None
+
+        if self._index_cache is None or self._index_cache[0] != stamp:
+            index: Dict[str, Dict[str, Any]] = {}
+            for ds_info in self._load_registry().get("datasets", {}).values():
+                index.setdefault(ds_info.get("name"), ds_info)
+            self._index_cache = (stamp, index)
+        return self._index_cache[1]
 
     def save(self) -> None:
         """Save the current registry state (for compatibility)."""
@@ -77,62 +111,73 @@ class DatasetRegistry:
 
     def exists(self, dataset_name: str) -> bool:
         """Check if dataset exists."""
-        registry = self._load_registry()
-        for ds_info in registry.get("datasets", {}).values():
-            if ds_info.get("name") == dataset_name:
-                return True
-        return False
+        return dataset_name in self._index()
 
-    def get_images(
+    def iter_images(
         self,
         dataset_name: str,
-        split: Optional[str] = None,
-        limit: int = 100,
-        offset: int = 0
-    ) -> tuple[List[Dict], int]:
-        """Get list of all images in the dataset."""
+        split: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """Yield image entries one at a time, scanning each split directory lazily."""
         dataset_path = self.datasets_dir / dataset_name
+        splits = [split] if split else ["train", "val", "test", "unlabeled"]
 
-        # Determine directories to scan
-        if split:
-            image_dirs = [dataset_path / "images" / split]
-        else:
-            image_dirs = [
-                dataset_path / "images" / s
-                for s in ["train", "val", "test", "unlabeled"]
-            ]
-
-        # Collect image files
-        images = []
-        for img_dir in image_dirs:
-            if not img_dir.exists():
+        for split_name in splits:
+            try:
+                it = os.scandir(dataset_path / split_name / "images")
+            except (FileNotFoundError, NotADirectoryError):
                 continue
 
-            split_name = img_dir.name
-            for img_file in img_dir.glob("*.*"):
-                if img_file.suffix.lower() in ['.jpg', '.jpeg', '.png', '.bmp', '.tiff']:
-                    label_dir = dataset_path / "labels" / split_name
-                    label_file = label_dir / f"{img_file.stem}.txt"
-
-                    images.append({
-                        'name': img_file.name,
-                        'path': str(img_file.relative_to(dataset_path)),
+            # One listing of labels/ instead of an exists() call per image
+            try:
+                labeled = {
+                    name[:-4] for name in os.listdir(dataset_path / split_name / "labels")
+                    if name.endswith(".txt")
+                }
+            except (FileNotFoundError, NotADirectoryError):
+                labeled = set()
+
+            with it:
+                for entry in it:
+                    stem, ext = os.path.splitext(entry.name)
+                    if ext.lower() not in VALID_IMAGE_EXTENSIONS or not entry.is_file():
+                        continue
+                    yield {
+                        'name': entry.name,
+                        'path': os.path.join(split_name, "images", entry.name),
                         'split': split_name,
-                        'size': img_file.stat().st_size,
-                        'has_label': label_file.exists()
-                    })
+                        'size': entry.stat().st_size,
+                        'has_label': stem in labeled
+                    }
 
+    def get_images(
+        self,
+        dataset_name: str,
+        split: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> tuple[List[Dict], int]:
+        """Get list of all images in the dataset."""
+        images = list(self.iter_images(dataset_name, split))
         total = len(images)
         images = images[offset:offset + limit]
         return images, total
 
     def get_dataset(self, dataset_name: str) -> Dict[str, Any]:
         """Get dataset info by name."""
-        registry = self._load_registry()
-        for ds_info in registry.get("datasets", {}).values():
-            if ds_info.get("name") == dataset_name:
-                return ds_info
-        raise DatasetNotFoundError(f"Dataset not found: {dataset_name}")
+        ds_info = self._index().get(dataset_name)
+        if ds_info is None:
+            raise DatasetNotFoundError(f"Dataset not found: {dataset_name}")
+        # Copy so callers can't alter the cached entry (e.g. its class list)
+        return copy.deepcopy(ds_info)
+
+    def get_datasets(self, dataset_names: List[str]) -> List[Dict[str, Any]]:
+        """Get info for several datasets from a single registry read."""
+        index = self._index()
+        missing = [name for name in dataset_names if name not in index]
+        if missing:
+            raise DatasetNotFoundError(f"Dataset not found: {', '.join(missing)}")
+        return [copy.deepcopy(index[name]) for name in dataset_names]
 
     def list_datasets(self) -> List[Dict[str, Any]]:
         """List all datasets."""
@@ -141,6 +186,18 @@ class DatasetRegistry:
 
     def add_dataset(self, dataset_info: Dict[str, Any]) -> None:
         """Add a new dataset to registry."""
+        self.add_datasets([dataset_info])
+
+    def add_datasets(
+        self,
+        dataset_infos: List[Dict[str, Any]],
+        remove_names: Iterable[str] = ()
+    ) -> None:
+        """
+        Add several datasets under one lock with a single registry write.
+
+        Datasets named in remove_names are dropped first, in the same write.
+        """
         from .io import FileLock
 
         with FileLock(self.registry_path):
@@ -148,13 +205,18 @@ class DatasetRegistry:
             if "datasets" not in registry:
                 registry["datasets"] = {}
 
-            dataset_id = dataset_info.get("id")
-            registry["datasets"][dataset_id] = dataset_info
+            remove_names = set(remove_names)
+            if remove_names:
+                registry["datasets"] = {
+                    ds_id: ds_info for ds_id, ds_info in registry["datasets"].items()
+                    if ds_info.get("name") not in remove_names
+                }
+
+            for dataset_info in dataset_infos:
+                registry["datasets"][dataset_info.get("id")] = dataset_info
 
             # Save without additional lock
-            self.registry_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.registry_path, 'w') as f:
-                yaml.safe_dump(registry, f, default_flow_style=False, sort_keys=False)
+            self._save_registry(registry)
 
     def remove_dataset(self, dataset_name: str) -> None:
         """Remove dataset from registry."""
@@ -173,9 +235,7 @@ class DatasetRegistry:
                 del registry["datasets"][dataset_id]
 
                 # Save without additional lock
-                self.registry_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(self.registry_path, 'w') as f:
-                    yaml.safe_dump(registry, f, default_flow_style=False, sort_keys=False)
+                self._save_registry(registry)
 
     def list_images(
         self,
@@ -206,9 +266,6 @@ class DatasetRegistry:
         Raises:
             DatasetNotFoundError: If dataset doesn't exist
         """
-        if not self.exists(dataset_name):
-            raise DatasetNotFoundError(f"Dataset not found: {dataset_name}")
-
         dataset_info = self.get_dataset(dataset_name)
         return dataset_info.get("classes", [])
 
@@ -312,7 +369,7 @@ class DatasetRegistry:
 
     def _update_classes(self, dataset_name: str, classes: List[Optional[str]]) -> None:
         """Update classes in registry, dataset.yaml, and manifest.json."""
-        from .io import FileLock
+        from .io import FileLock, atomic_write_json
 
         with FileLock(self.registry_path):
             registry = self._load_registry()
@@ -335,9 +392,7 @@ class DatasetRegistry:
             registry["datasets"][dataset_id]["num_classes"] = len(clean_classes)
 
             # Save without additional lock
-            self.registry_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.registry_path, 'w') as f:
-                yaml.safe_dump(registry, f, default_flow_style=False, sort_keys=False)
+            self._save_registry(registry)
 
         # Update dataset files (outside the lock)
         dataset_path = self.datasets_dir / dataset_name
@@ -375,9 +430,7 @@ class DatasetRegistry:
                 manifest = json.load(f)
 
             manifest["classes"] = clean_classes
-
-            with open(manifest_json, 'w') as f:
-                json.dump(manifest, f, indent=2)
+            atomic_write_json(manifest_json, manifest)
 
 
 class RunRegistry:
@@ -395,13 +448,15 @@ class RunRegistry:
     def __init__(self, project_root: Path):
         self.project_root = Path(project_root)
         self.registry_path = self.project_root / ".modelcub" / "runs.yaml"
+        # (registry file stat, runs keyed by ID); see _runs()
+        self._runs_cache: Optional[tuple] = None
 
     def _load_registry(self) -> Dict:
         """Load runs registry from YAML."""
-        if not self.registry_path.exists():
+        try:
+            return _load_yaml(self.registry_path) or {"runs": {}}
+        except FileNotFoundError:
             return {"runs": {}}
-        with open(self.registry_path, 'r') as f:
-            return yaml.safe_load(f) or {"runs": {}}
 
     def _save_registry(self, registry: Dict) -> None:
         """Save registry with atomic write and file lock."""
@@ -414,6 +469,30 @@ class RunRegistry:
                 sort_keys=False
             )
             atomic_write(self.registry_path, content)
+        self._runs_cache = None
+
+    def _write_registry(self, registry: Dict) -> None:
+        """Write the registry; the caller already holds the file lock."""
+        self.registry_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.registry_path, 'w') as f:
+            yaml.safe_dump(registry, f, default_flow_style=False, sort_keys=False)
+        self._runs_cache = None
+
+    def _runs(self) -> Dict[str, Dict[str, Any]]:
+        """Runs keyed by ID, re-parsed only when runs.yaml changes.
+
+        Keyed on the file's mtime and size like DatasetRegistry._index(), so
+        status polling re-reads the YAML only after something was written.
+        """
+        try:
+            st = os.stat(self.registry_path)
+            stamp = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            stamp = None
+
+        if self._runs_cache is None or self._runs_cache[0] != stamp:
+            self._runs_cache = (stamp, self._load_registry().get("runs") or {})
+        return self._runs_cache[1]
 
     def _validate_transition(self, current_status: str, new_status: str) -> None:
         """
@@ -429,13 +508,12 @@ class RunRegistry:
 
     def list_runs(self) -> List[Dict[str, Any]]:
         """List all training runs."""
-        registry = self._load_registry()
-        return list(registry.get("runs", {}).values())
+        return copy.deepcopy(list(self._runs().values()))
 
     def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
         """Get run info by ID."""
-        registry = self._load_registry()
-        return registry.get("runs", {}).get(run_id)
+        run = self._runs().get(run_id)
+        return copy.deepcopy(run) if run is not None else None
 
     def add_run(self, run_info: Dict[str, Any]) -> None:
         """Add a new run to registry."""
@@ -450,9 +528,7 @@ class RunRegistry:
             registry["runs"][run_id] = run_info
 
             # Save without additional lock (we already hold it)
-            self.registry_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.registry_path, 'w') as f:
-                yaml.safe_dump(registry, f, default_flow_style=False, sort_keys=False)
+            self._write_registry(registry)
 
     def update_run(self, run_id: str, updates: Dict[str, Any]) -> None:
         """
@@ -482,23 +558,24 @@ class RunRegistry:
             registry["runs"][run_id].update(updates)
 
             # Save without additional lock
-            self.registry_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.registry_path, 'w') as f:
-                yaml.safe_dump(registry, f, default_flow_style=False, sort_keys=False)
+            self._write_registry(registry)
 
     def remove_run(self, run_id: str) -> None:
         """Remove run from registry."""
+        self.remove_runs([run_id])
+
+    def remove_runs(self, run_ids: List[str]) -> None:
+        """Remove several runs under one lock and one registry write (unknown IDs are ignored)."""
         from .io import FileLock
 
         with FileLock(self.registry_path):
             registry = self._load_registry()
-            if run_id in registry.get("runs", {}):
-                del registry["runs"][run_id]
+            runs = registry.get("runs", {})
+            removed = [run_id for run_id in run_ids if runs.pop(run_id, None) is not None]
 
+            if removed:
                 # Save without additional lock
-                self.registry_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(self.registry_path, 'w') as f:
-                    yaml.safe_dump(registry, f, default_flow_style=False, sort_keys=False)
+                self._write_registry(registry)
 
 
 class ModelRegistry:
@@ -516,12 +593,12 @@ class ModelRegistry:
 
     def _load_registry(self) -> Dict:
         """Load models registry from YAML."""
-        if not self.registry_path.exists():
+        try:
+            with open(self.registry_path, 'r') as f:
+                return yaml.safe_load(f) or {"models": {}}
+        except FileNotFoundError:
             return {"models": {}}
 
-        with open(self.registry_path, 'r') as f:
-            return yaml.safe_load(f) or {"models": {}}
-
     def _save_registry(self, registry: Dict) -> None:
         """Save registry with atomic write and file lock."""
         from .io import atomic_write, FileLock
@@ -539,7 +616,8 @@ class ModelRegistry:
         name: str,
         run_id: str,
         model_path: Path,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        stat_result: Optional[os.stat_result] = None
     ) -> str:
         """
         Promote a trained model to production.
@@ -549,6 +627,7 @@ class ModelRegistry:
             run_id: Training run that produced this model
             model_path: Path to model weights (e.g., best.pt)
             metadata: Optional metadata (metrics, description, etc.)
+            stat_result: os.stat() of model_path if the caller already has it
 
         Returns:
             Version identifier for the promoted model
@@ -560,8 +639,11 @@ class ModelRegistry:
         from .io import FileLock
         import shutil
 
-        if not model_path.exists():
-            raise FileNotFoundError(f"Model file not found: {model_path}")
+        if stat_result is None:
+            try:
+                os.stat(model_path)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Model file not found: {model_path}") from None
 
         with FileLock(self.registry_path):
             registry = self._load_registry()
@@ -611,6 +693,27 @@ class ModelRegistry:
         registry = self._load_registry()
         return registry["models"].get(name)
 
+    def exists_model(self, name: str) -> bool:
+        """
+        Check if a model is registered.
+
+        Args:
+            name: Model name
+
+        Returns:
+            True if model exists
+        """
+        return name in self._load_registry()["models"]
+
+    def count_models(self) -> int:
+        """
+        Count promoted models.
+
+        Returns:
+            Number of models in the registry
+        """
+        return len(self._load_registry()["models"])
+
     def list_models(self) -> list[Dict[str, Any]]:
         """
         List all promoted models.
@@ -631,22 +734,36 @@ class ModelRegistry:
         Raises:
             ValueError: If model not found
         """
+        self.remove_models([name])
+
+    def remove_models(self, names: List[str]) -> None:
+        """
+        Remove several promoted models under one lock and one registry write.
+
+        Args:
+            names: Model names
+
+        Raises:
+            ValueError: If any model is not found (nothing is removed)
+        """
         from .io import FileLock
         import shutil
 
         with FileLock(self.registry_path):
             registry = self._load_registry()
 
-            if name not in registry["models"]:
-                raise ValueError(f"Model not found: {name}")
+            missing = [name for name in names if name not in registry["models"]]
+            if missing:
+                raise ValueError(f"Model not found: {', '.join(missing)}")
 
-            # Remove model directory
-            model_dir = self.models_dir / name
-            if model_dir.exists():
-                shutil.rmtree(model_dir)
+            for name in names:
+                # Remove model directory
+                model_dir = self.models_dir / name
+                if model_dir.exists():
+                    shutil.rmtree(model_dir)
 
-            # Remove from registry
-            del registry["models"][name]
+                # Remove from registry
+                del registry["models"][name]
 
             # Save without additional lock
             self.registry_path.parent.mkdir(parents=True, exist_ok=True)
@@ -663,12 +780,12 @@ class InferenceRegistry:
 
     def _load_registry(self) -> Dict:
         """Load inferences registry from YAML."""
-        if not self.registry_path.exists():
+        try:
+            with open(self.registry_path, 'r') as f:
+                return yaml.safe_load(f) or {"inferences": {}}
+        except FileNotFoundError:
             return {"inferences": {}}
 
-        with open(self.registry_path, 'r') as f:
-            return yaml.safe_load(f) or {"inferences": {}}
-
     def _save_registry(self, registry: Dict) -> None:
         """Save registry with atomic write and file lock."""
         from .io import atomic_write, FileLock
@@ -8,7 +8,7 @@ from .project import Project
 from .dataset import Dataset, DatasetInfo, Box
 from .job import JobManager, Job, JobStatus, TaskStatus
 from .training_run import TrainingRun, TrainingManager, RunMetrics
-from .promoted_model import PromotedModel, InferenceResult
+from .promoted_model import PromotedModel, InferenceResult, SpecializedPredictor
 from .model_manager import ModelManager
 
 __all__ = [
@@ -35,4 +35,5 @@ __all__ = [
     "PromotedModel",
     "ModelManager",
     "InferenceResult",
+    "SpecializedPredictor",
 ]
\ No newline at end of file
@@ -5,16 +5,137 @@ Provides high-level Python API for dataset operations.
 """
 from __future__ import annotations
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+import os
 import shutil
 import json
 
 from ..core.registries import DatasetRegistry
-from ..core.paths import project_root
+from ..core.compat import DATACLASS_SLOTS
+from ..core.exceptions import ClassExistsError, ClassNotFoundError
+from ..core.paths import project_root, resolve_path
+from ..core.images import VALID_IMAGE_EXTENSIONS
+from ..core.io_utils import delete_tree_in_background, sweep_trash
+from ..services import annotation_service, split_service
+from ..services.annotation_service import (
+    GetAnnotationRequest, SaveAnnotationRequest, SaveAnnotationsBatchRequest,
+    DeleteAnnotationRequest, BoundingBox
+)
+
+_SPLITS = ("train", "val", "test", "unlabeled")
+_MAX_WALK_WORKERS = 8
+
+
+def _scandir_files(path: str | Path) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield file entries under path using os.scandir.
+
+    Symlinked files are yielded (imports with copy=False link to their
+    source images); symlinked directories are not descended into.
+    """
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scandir_files(entry.path)
+                elif entry.is_file():
+                    yield entry
+    except OSError:
+        return
+
+
+def _tree_size(path: str | Path) -> int:
+    """Total size in bytes of all files under path."""
+    return sum(entry.stat().st_size for entry in _scandir_files(path))
+
+
+def _dir_size(root: Path) -> int:
+    """
+    Total size in bytes of all files under root.
+
+    Top-level subdirectories (the splits) are walked concurrently; the
+    scandir/stat syscalls release the GIL, so threads overlap their I/O.
+    """
+    total = 0
+    subdirs = []
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file():
+                    total += entry.stat().st_size
+    except OSError:
+        return 0
+
+    if len(subdirs) < 2:
+        return total + sum(map(_tree_size, subdirs))
+    with ThreadPoolExecutor(max_workers=min(len(subdirs), _MAX_WALK_WORKERS)) as executor:
+        return total + sum(executor.map(_tree_size, subdirs))
+
+
+def _tree_stamp(root: Path, depth: int = 2) -> tuple:
+    """
+    Modification times of root and its subdirectories down to depth.
+
+    Adding, removing or renaming a file bumps its parent directory's mtime,
+    so for the <split>/images layout this changes whenever the files do,
+    for a handful of stat() calls instead of one per file.
+    """
+    stamps = []
+    pending = [(os.fspath(root), depth)]
+    while pending:
+        path, remaining = pending.pop()
+        try:
+            stamps.append((path, os.stat(path).st_mtime_ns))
+            if remaining:
+                with os.scandir(path) as it:
+                    pending.extend(
+                        (entry.path, remaining - 1)
+                        for entry in it if entry.is_dir(follow_symlinks=False)
+                    )
+        except OSError:
+            continue
+    return tuple(sorted(stamps))
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def _format_size(size_bytes: int) -> str:
+    """Format a byte count as a human-readable size, picking the unit from bit_length."""
+    idx = min(max(size_bytes.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
+
+
+def _count_images(directory: Path) -> int:
+    """Count image files directly inside directory (0 if it doesn't exist)."""
+    try:
+        it = os.scandir(directory)
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
+    with it:
+        return sum(
+            1 for entry in it
+            if entry.is_file()
+            and os.path.splitext(entry.name)[1].lower() in VALID_IMAGE_EXTENSIONS
+        )
 
 
-@dataclass
+def _resolve_project_path(project_path: Optional[str | Path]) -> Path:
+    """Resolve a project directory (searching upward if None) and verify it."""
+    root = resolve_path(project_path) if project_path else project_root()
+
+    if not (root / ".modelcub").exists():
+        raise ValueError(f"Not a valid project: {root}")
+
+    return root
+
+
+@dataclass(**DATACLASS_SLOTS)
 class DatasetInfo:
     """Dataset information."""
     name: str
@@ -29,14 +150,14 @@ class DatasetInfo:
     source: Optional[str] = None
 
 
-@dataclass
-class Box:
-    """Bounding box in YOLO format (normalized 0-1)."""
-    class_id: int
-    x: float
-    y: float
-    w: float
-    h: float
+@dataclass(**DATACLASS_SLOTS)
+class Box(BoundingBox):
+    """
+    Bounding box in YOLO format (normalized 0-1).
+
+    Shares its field layout with the annotation service's BoundingBox, so
+    boxes are handed to save_annotation() without being copied.
+    """
 
     def to_dict(self) -> Dict[str, Any]:
         return {"class_id": self.class_id, "x": self.x, "y": self.y, "w": self.w, "h": self.h}
@@ -52,6 +173,8 @@ class Dataset:
         >>> dataset.fix(auto=True)
     """
 
+    __slots__ = ("name", "_project_path", "_registry", "_data", "_dataset_path", "_size_cache")
+
     def __init__(self, name: str, project_path: Optional[str | Path] = None):
         """
         Initialize Dataset.
@@ -61,24 +184,35 @@ class Dataset:
             project_path: Project directory (searches upward if not provided)
         """
         self.name = name
-
-        if project_path:
-            self._project_path = Path(project_path).resolve()
-        else:
-            self._project_path = project_root()
-
-        # Verify project exists
-        if not (self._project_path / ".modelcub").exists():
-            raise ValueError(f"Not a valid project: {self._project_path}")
+        self._project_path = _resolve_project_path(project_path)
 
         # Verify dataset exists
-        registry = DatasetRegistry(self._project_path)
-        self._data = registry.get_dataset(name)
+        self._registry = DatasetRegistry(self._project_path)
+        self._data = self._registry.get_dataset(name)
 
         if not self._data:
             raise ValueError(f"Dataset not found: {name}")
 
         self._dataset_path = self._project_path / "data" / "datasets" / name
+        self._size_cache: Optional[tuple] = None
+        sweep_trash(self._project_path / ".modelcub" / "trash")
+
+    @classmethod
+    def _from_preloaded(
+        cls,
+        data: Dict[str, Any],
+        project_path: Path,
+        registry: DatasetRegistry
+    ) -> Dataset:
+        """Build a Dataset from an already-loaded registry entry without any I/O."""
+        dataset = cls.__new__(cls)
+        dataset.name = data["name"]
+        dataset._project_path = project_path
+        dataset._registry = registry
+        dataset._data = data
+        dataset._dataset_path = project_path / "data" / "datasets" / dataset.name
+        dataset._size_cache = None
+        return dataset
 
     # ========== Properties ==========
 
@@ -104,25 +238,14 @@ class Dataset:
 
     @property
     def size(self) -> str:
-        # Calculate size
-        size_bytes = 0
-        try:
-            for item in self._dataset_path.rglob("*"):
-                if item.is_file():
-                    size_bytes += item.stat().st_size
-        except Exception:
-            pass
-
-        # Format size
-        size_display = size_bytes
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_display < 1024:
-                size_str = f"{size_display:.1f} {unit}"
-                break
-            size_display /= 1024
-        else:
-            size_str = f"{size_display:.1f} TB"
+        """Human-readable dataset size (recomputed only when the tree changes)."""
+        stamp = _tree_stamp(self._dataset_path)
+        if self._size_cache is not None and self._size_cache[0] == stamp:
+            return self._size_cache[1]
 
+        size_str = _format_size(_dir_size(self._dataset_path))
+        self._size_cache = (stamp, size_str)
+        return size_str
 
     @classmethod
     def load(cls, name: str, project_path: Optional[str | Path] = None) -> Dataset:
@@ -146,6 +269,65 @@ class Dataset:
         """
         return cls(name, project_path)
 
+    @classmethod
+    def list(cls, project_path: Optional[str | Path] = None) -> List[Dataset]:
+        """
+        List all datasets in a project.
+
+        Reads the dataset registry once and builds every Dataset from it.
+
+        Args:
+            project_path: Project directory (searches upward if not provided)
+
+        Returns:
+            List of Dataset instances
+
+        Raises:
+            ValueError: If not in a valid project
+
+        Example:
+            >>> for dataset in Dataset.list():
+            ...     print(dataset.name, dataset.images)
+        """
+        root = _resolve_project_path(project_path)
+        registry = DatasetRegistry(root)
+
+        return [
+            cls._from_preloaded(ds_dict, root, registry)
+            for ds_dict in registry.list_datasets()
+        ]
+
+    @staticmethod
+    def exists(
+        name: str,
+        project_path: Optional[str | Path] = None,
+        strict: bool = False
+    ) -> bool:
+        """
+        Check if a dataset exists without loading it.
+
+        Args:
+            name: Dataset name
+            project_path: Project directory (searches upward if not provided)
+            strict: Consult the dataset registry instead of the manifest file
+
+        Returns:
+            True if the dataset exists
+
+        Example:
+            >>> if Dataset.exists("pills-v1"):
+            ...     dataset = Dataset.load("pills-v1")
+        """
+        root = resolve_path(project_path) if project_path else project_root()
+
+        if strict:
+            return DatasetRegistry(root).exists(name)
+
+        # A single stat: the manifest implies the dataset directory exists
+        return os.path.isfile(
+            os.path.join(root, "data", "datasets", name, "manifest.json")
+        )
+
 
     def info(self) -> DatasetInfo:
         """
@@ -158,34 +340,15 @@ class Dataset:
             >>> info = dataset.info()
             >>> print(info.total_images)
         """
-        # Calculate size
-        size_bytes = 0
-        try:
-            for item in self._dataset_path.rglob("*"):
-                if item.is_file():
-                    size_bytes += item.stat().st_size
-        except Exception:
-            pass
-
-        # Format size
-        size_display = size_bytes
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_display < 1024:
-                size_str = f"{size_display:.1f} {unit}"
-                break
-            size_display /= 1024
-        else:
-            size_str = f"{size_display:.1f} TB"
-
         return DatasetInfo(
             name=self.name,
             id=self._data.get("id", self.name),
             path=self._dataset_path,
             images=self.images,
-            classes=self.list_classes(),
+            classes=list(self._data.get("classes") or []),
             status=self.status,
             total_images=self.images,
-            size=size_str,
+            size=self.size,
             created=self._data.get("created"),
             source=self._data.get("source"),
 
@@ -204,14 +367,9 @@ class Dataset:
             >>> counts = dataset.get_split_counts()
             >>> print(f"Train: {counts['train']}")
         """
-        splits = {}
-        for split in ["train", "val", "test", "unlabeled"]:
-            split_dir = self._dataset_path / split / "images"
-            if split_dir.exists():
-                splits[split] = sum(1 for _ in split_dir.glob("*.*"))
-            else:
-                splits[split] = 0
-        return splits
+        dirs = [self._dataset_path / split / "images" for split in _SPLITS]
+        with ThreadPoolExecutor(max_workers=len(_SPLITS)) as executor:
+            return dict(zip(_SPLITS, executor.map(_count_images, dirs)))
 
 
 
@@ -238,8 +396,36 @@ class Dataset:
             >>> images, total = dataset.list_images(split='train', limit=10)
             >>> print(f"Found {total} images, showing {len(images)}")
         """
-        registry = DatasetRegistry(self._project_path)
-        return registry.list_images(self.name, split, limit, offset)
+        return self._registry.list_images(self.name, split, limit, offset)
+
+    def iter_images(
+        self,
+        split: Optional[str] = None,
+        batch_size: int = 1000
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate over all images in this dataset in batches.
+
+        Unlike paging through list_images(), this makes a single pass over
+        the split directories and never holds more than one batch in memory.
+
+        Args:
+            split: Optional split filter ('train', 'val', 'test', 'unlabeled')
+            batch_size: Max number of images per batch
+
+        Yields:
+            Lists of image dicts, at most batch_size long
+
+        Example:
+            >>> for batch in dataset.iter_images(split='train'):
+            ...     print(len(batch))
+        """
+        images = self._registry.iter_images(self.name, split)
+        while True:
+            batch = list(islice(images, batch_size))
+            if not batch:
+                return
+            yield batch
 
 
     # ========== Class Management ==========
@@ -256,8 +442,7 @@ class Dataset:
             >>> print(classes)
             ['cat', 'dog', 'bird']
         """
-        registry = DatasetRegistry(self._project_path)
-        return registry.list_classes(self.name)
+        return self._registry.list_classes(self.name)
 
     def add_class(self, class_name: str, class_id: Optional[int] = None) -> int:
         """
@@ -281,17 +466,22 @@ class Dataset:
             >>> dataset.add_class('fish', class_id=5)
             5
         """
-        from ..core.exceptions import ClassExistsError
-
-        registry = DatasetRegistry(self._project_path)
-
         try:
-            assigned_id = registry.add_class(self.name, class_name, class_id)
-            self.reload()  # Reload to get updated classes
-            return assigned_id
+            assigned_id = self._registry.add_class(self.name, class_name, class_id)
         except ClassExistsError as e:
             raise ValueError(str(e))
 
+        # Mirror the registry update locally instead of re-reading it
+        classes = list(self._data.get("classes", []))
+        if class_id is None:
+            classes.append(class_name)
+        else:
+            classes.extend([None] * (assigned_id + 1 - len(classes)))
+            classes[assigned_id] = class_name
+        self._set_classes(classes)
+
+        return assigned_id
+
     def remove_class(self, class_name: str) -> None:
         """
         Remove a class from this dataset.
@@ -307,16 +497,13 @@ class Dataset:
         Example:
             >>> dataset.remove_class('cat')
         """
-        from ..core.exceptions import ClassNotFoundError
-
-        registry = DatasetRegistry(self._project_path)
-
         try:
-            registry.remove_class(self.name, class_name)
-            self.reload()  # Reload metadata
+            self._registry.remove_class(self.name, class_name)
         except ClassNotFoundError as e:
             raise ValueError(str(e))
 
+        self._set_classes([c for c in self._data.get("classes", []) if c != class_name])
+
     def rename_class(self, old_name: str, new_name: str) -> None:
         """
         Rename a class in this dataset.
@@ -331,16 +518,22 @@ class Dataset:
         Example:
             >>> dataset.rename_class('cat', 'feline')
         """
-        from ..core.exceptions import ClassNotFoundError, ClassExistsError
-
-        registry = DatasetRegistry(self._project_path)
-
         try:
-            registry.rename_class(self.name, old_name, new_name)
-            self.reload()  # Reload metadata
+            self._registry.rename_class(self.name, old_name, new_name)
         except (ClassNotFoundError, ClassExistsError) as e:
             raise ValueError(str(e))
 
+        self._set_classes([
+            new_name if c == old_name else c
+            for c in self._data.get("classes", [])
+        ])
+
+    def _set_classes(self, classes: List[Optional[str]]) -> None:
+        """Apply a class list change to cached metadata (mirrors the registry)."""
+        classes = [c for c in classes if c is not None]
+        self._data["classes"] = classes
+        self._data["num_classes"] = len(classes)
+
     # ========== Validation & Fixing ==========
 
     def validate(self) -> Dict[str, Any]:
@@ -412,12 +605,15 @@ class Dataset:
 
     # ========== Dataset Operations ==========
 
-    def delete(self, confirm: bool = False) -> None:
+    def delete(self, confirm: bool = False, background: bool = False) -> None:
         """
         Delete this dataset.
 
         Args:
             confirm: Must be True to actually delete
+            background: Move the directory to .modelcub/trash/ and remove it
+                on a background thread, so large datasets return immediately
+                (the process waits for the removal to finish before exiting)
 
         Raises:
             ValueError: If confirm is not True
@@ -428,13 +624,13 @@ class Dataset:
         if not confirm:
             raise ValueError("Must pass confirm=True to delete dataset")
 
-        registry = DatasetRegistry(self._project_path)
-
         # Remove from registry
-        registry.remove_dataset(self.name)
+        self._registry.remove_dataset(self.name)
 
         # Delete directory
-        if self._dataset_path.exists():
+        if background:
+            delete_tree_in_background(self._dataset_path, self._project_path / ".modelcub" / "trash")
+        elif self._dataset_path.exists():
             shutil.rmtree(self._dataset_path)
 
     def reload(self) -> None:
@@ -444,8 +640,8 @@ class Dataset:
         Example:
             >>> dataset.reload()
         """
-        registry = DatasetRegistry(self._project_path)
-        self._data = registry.get_dataset(self.name)
+        self._data = self._registry.get_dataset(self.name)
+        self._size_cache = None
 
         if not self._data:
             raise ValueError(f"Dataset no longer exists: {self.name}")
@@ -465,15 +661,13 @@ class Dataset:
         Raises:
             ValueError: If annotation retrieval fails
         """
-        from ..services.annotation_service import get_annotation, GetAnnotationRequest
-
         req = GetAnnotationRequest(
             dataset_name=self.name,
             image_id=image_id,
             project_path=self._project_path
         )
 
-        result = get_annotation(req)
+        result = annotation_service.get_annotation(req)
 
         if not result.success:
             raise ValueError(f"Failed to get annotation: {result.message}")
@@ -490,15 +684,13 @@ class Dataset:
         Raises:
             ValueError: If annotation retrieval fails
         """
-        from ..services.annotation_service import get_annotation, GetAnnotationRequest
-
         req = GetAnnotationRequest(
             dataset_name=self.name,
             image_id=None,
             project_path=self._project_path
         )
 
-        result = get_annotation(req)
+        result = annotation_service.get_annotation(req)
 
         if not result.success:
             raise ValueError(f"Failed to get annotations: {result.message}")
@@ -520,18 +712,8 @@ class Dataset:
         Raises:
             ValueError: If save fails
         """
-        from ..services.annotation_service import (
-            save_annotation, SaveAnnotationRequest, BoundingBox
-        )
-
         bbox_list = [
-            BoundingBox(
-                class_id=b.class_id,
-                x=b.x,
-                y=b.y,
-                w=b.w,
-                h=b.h
-            )
+            b if isinstance(b, BoundingBox) else BoundingBox(b.class_id, b.x, b.y, b.w, b.h)
             for b in boxes
         ]
 
@@ -542,13 +724,50 @@ class Dataset:
             project_path=self._project_path
         )
 
-        result = save_annotation(req)
+        result = annotation_service.save_annotation(req)
 
         if not result.success:
             raise ValueError(f"Failed to save annotation: {result.message}")
 
         return result.data if result.data else {}
 
+    def save_annotations(self, annotations: Dict[str, List[Box]]) -> Dict[str, Any]:
+        """
+        Save annotations for many images in one service call.
+
+        Args:
+            annotations: Mapping of image_id to its bounding boxes
+
+        Returns:
+            Dict with {"success": [...], "failed": [...], "num_boxes": int}
+
+        Raises:
+            ValueError: If the batch fails as a whole
+
+        Example:
+            >>> dataset.save_annotations({"img_001": [Box(0, 0.5, 0.5, 0.2, 0.2)]})
+        """
+        items = {
+            image_id: [
+                b if isinstance(b, BoundingBox) else BoundingBox(b.class_id, b.x, b.y, b.w, b.h)
+                for b in boxes
+            ]
+            for image_id, boxes in annotations.items()
+        }
+
+        req = SaveAnnotationsBatchRequest(
+            dataset_name=self.name,
+            items=items,
+            project_path=self._project_path
+        )
+
+        result = annotation_service.save_annotations_batch(req)
+
+        if not result.success:
+            raise ValueError(f"Failed to save annotations: {result.message}")
+
+        return result.data if result.data else {}
+
     def delete_box(self, image_id: str, box_index: int) -> Dict[str, Any]:
         """
         Delete a specific bounding box from an image.
@@ -563,8 +782,6 @@ class Dataset:
         Raises:
             ValueError: If deletion fails
         """
-        from ..services.annotation_service import delete_annotation, DeleteAnnotationRequest
-
         req = DeleteAnnotationRequest(
             dataset_name=self.name,
             image_id=image_id,
@@ -572,7 +789,7 @@ class Dataset:
             project_path=self._project_path
         )
 
-        result = delete_annotation(req)
+        result = annotation_service.delete_annotation(req)
 
         if not result.success:
             raise ValueError(f"Failed to delete box: {result.message}")
@@ -589,9 +806,7 @@ class Dataset:
         Raises:
             ValueError: If stats retrieval fails
         """
-        from ..services.annotation_service import get_annotation_stats
-
-        result = get_annotation_stats(self.name, self._project_path)
+        result = annotation_service.get_annotation_stats(self.name, self._project_path)
 
         if not result.success:
             raise ValueError(f"Failed to get stats: {result.message}")
@@ -634,9 +849,7 @@ class Dataset:
             ...     source_split="unlabeled", shuffle=True
             ... )
         """
-        from ..services.split_service import auto_split_by_percentage
-
-        result = auto_split_by_percentage(
+        result = split_service.auto_split_by_percentage(
             project_path=self._project_path,
             dataset_name=self.name,
             train_pct=train_pct,
@@ -672,9 +885,7 @@ class Dataset:
             >>> dataset.move_to_split("img_001", "train")
             {'image_id': 'img_001', 'from_split': 'unlabeled', 'to_split': 'train'}
         """
-        from ..services.split_service import move_to_split
-
-        result = move_to_split(
+        result = split_service.move_to_split(
             project_path=self._project_path,
             dataset_name=self.name,
             image_id=image_id,
@@ -710,9 +921,7 @@ class Dataset:
             >>> result = dataset.batch_assign_splits(assignments)
             >>> print(f"Success: {len(result['success'])}")
         """
-        from ..services.split_service import batch_move_to_splits
-
-        result = batch_move_to_splits(
+        result = split_service.batch_move_to_splits(
             project_path=self._project_path,
             dataset_name=self.name,
             assignments=assignments
@@ -728,7 +937,10 @@ class Dataset:
     # ========== String Representations ==========
 
     def __repr__(self) -> str:
-        return f"Dataset(name='{self.name}', images={self.images}, status='{self.status}')"
+        data = self._data
+        return "Dataset(name='%s', images=%s, status='%s')" % (
+            self.name, data.get("num_images", 0), data.get("status", "ready")
+        )
 
     def __str__(self) -> str:
-        return f"Dataset: {self.name} ({self.images} images)"
\ No newline at end of file
+        return "Dataset: %s (%s images)" % (self.name, self._data.get("num_images", 0))
\ No newline at end of file
@@ -7,6 +7,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Callable
 from datetime import datetime
+import time
 
 from ..services.annotation_job_manager import (
     AnnotationJobManager,
@@ -88,12 +89,19 @@ class Job:
         self._data = self._manager.get_job(self.id)
         return self
 
-    def wait(self, poll_interval: float = 1.0) -> Job:
-        """Wait for job to complete."""
-        import time
+    def wait(self, poll_interval: float = 1.0, max_interval: float = 30.0) -> Job:
+        """
+        Wait for job to complete.
+
+        Polls with exponential backoff, starting at poll_interval and
+        growing by 1.5x per check up to max_interval, so long jobs cost
+        O(log duration) refreshes rather than one per poll_interval.
+        """
+        interval = poll_interval
         while not self._data.is_terminal:
-            time.sleep(poll_interval)
+            time.sleep(interval)
             self.refresh()
+            interval = min(interval * 1.5, max(max_interval, poll_interval))
         return self
 
     def get_tasks(self, status: Optional[TaskStatus] = None) -> List[AnnotationTask]:
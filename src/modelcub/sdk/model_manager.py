@@ -5,8 +5,12 @@ Provides high-level Python API for managing promoted models.
 """
 from __future__ import annotations
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
+import os
+import sys
 
+from ..core.paths import resolve_path
+from ..core.registries import RunRegistry, ModelRegistry
 from .promoted_model import PromotedModel
 
 
@@ -29,7 +33,9 @@ class ModelManager:
         Args:
             project_path: Project directory path
         """
-        self._project_path = Path(project_path).resolve()
+        self._project_path = resolve_path(project_path)
+        self._run_registry = RunRegistry(self._project_path)
+        self._model_registry = ModelRegistry(self._project_path)
 
     def promote(
         self,
@@ -68,13 +74,8 @@ class ModelManager:
             ...     tags=["production", "v2"]
             ... )
         """
-        from ..core.registries import RunRegistry, ModelRegistry
-
-        run_registry = RunRegistry(self._project_path)
-        model_registry = ModelRegistry(self._project_path)
-
         # Get run info
-        run = run_registry.get_run(run_id)
+        run = self._run_registry.get_run(run_id)
         if not run:
             raise ValueError(f"Run not found: {run_id}")
 
@@ -88,8 +89,10 @@ class ModelManager:
         weights_dir = run_path / 'train' / 'weights'
         best_weights = weights_dir / 'best.pt'
 
-        if not best_weights.exists():
-            raise FileNotFoundError(f"Best weights not found: {best_weights}")
+        try:
+            weights_stat = os.stat(best_weights)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Best weights not found: {best_weights}") from None
 
         # Prepare metadata
         model_metadata = metadata or {}
@@ -98,16 +101,19 @@ class ModelManager:
         model_metadata['config'] = run['config']
         model_metadata['dataset_name'] = run['dataset_name']
         model_metadata['dataset_snapshot_id'] = run['dataset_snapshot_id']
+        model_metadata['size_bytes'] = weights_stat.st_size
+        model_metadata['mtime_ns'] = weights_stat.st_mtime_ns
 
         if tags:
             model_metadata['tags'] = tags
 
         # Promote model
-        model_registry.promote_model(
+        self._model_registry.promote_model(
             name=name,
             run_id=run_id,
             model_path=best_weights,
-            metadata=model_metadata
+            metadata=model_metadata,
+            stat_result=weights_stat
         )
 
         return PromotedModel(name, self._project_path)
@@ -143,37 +149,92 @@ class ModelManager:
             >>> for model in models:
             ...     print(f"{model.name}: {model.version}")
         """
-        from ..core.registries import ModelRegistry
-
-        registry = ModelRegistry(self._project_path)
-        model_dicts = registry.list_models()
+        model_dicts = self._model_registry.list_models()
 
         return [
-            PromotedModel(model['name'], self._project_path)
+            PromotedModel._from_preloaded(model, self._project_path)
             for model in model_dicts
         ]
 
-    def remove(self, name: str, force: bool = False) -> None:
+    def remove(
+        self,
+        name: str,
+        force: bool = False,
+        confirm: bool | Callable[[str], bool] | None = None
+    ) -> None:
         """
         Remove a promoted model.
 
         Args:
             name: Model name
             force: Skip confirmation
+            confirm: True to proceed like force, or a callback deciding
+                whether to remove; otherwise (without force) the user is
+                prompted, which requires a TTY
+
+        Raises:
+            ValueError: If not confirmable non-interactively
 
         Example:
             >>> models.remove("detector-v1", force=True)
+            >>> models.remove("detector-v1", confirm=lambda name: name.endswith("-old"))
         """
-        from ..core.registries import ModelRegistry
+        if not force and not self._confirm(f"Delete model '{name}'?", name, confirm):
+            print("Cancelled")
+            return
 
-        if not force:
-            response = input(f"Delete model '{name}'? (y/n): ")
-            if response.lower() != 'y':
-                print("Cancelled")
-                return
+        self._model_registry.remove_model(name)
 
-        registry = ModelRegistry(self._project_path)
-        registry.remove_model(name)
+    def remove_many(
+        self,
+        names: List[str],
+        force: bool = False,
+        confirm: bool | Callable[[List[str]], bool] | None = None
+    ) -> None:
+        """
+        Remove several promoted models with one registry write.
+
+        Args:
+            names: Model names
+            force: Skip confirmation
+            confirm: True to proceed like force, or a callback called once
+                with the list of names, deciding whether to remove them;
+                otherwise (without force) the user is prompted, which
+                requires a TTY
+
+        Raises:
+            ValueError: If not confirmable non-interactively, or if any
+                model is not found (nothing is removed)
+
+        Example:
+            >>> models.remove_many(["detector-v1", "detector-v2"], force=True)
+            >>> models.remove_many(names, confirm=lambda names: all(n.endswith("-old") for n in names))
+        """
+        if not names:
+            return
+
+        prompt = f"Delete {len(names)} models ({', '.join(names)})?"
+        if not force and not self._confirm(prompt, list(names), confirm):
+            print("Cancelled")
+            return
+
+        self._model_registry.remove_models(names)
+
+    @staticmethod
+    def _confirm(prompt: str, subject: Any, confirm: bool | Callable[[Any], bool] | None) -> bool:
+        """Ask the callback (with subject), or the user on a TTY, whether to proceed."""
+        if confirm is True:
+            return True
+        if callable(confirm):
+            return bool(confirm(subject))
+
+        if not sys.stdin.isatty():
+            raise ValueError(
+                "Cannot prompt for confirmation without a terminal; "
+                "pass force=True or a confirm callback"
+            )
+
+        return input(f"{prompt} (y/n): ").lower() == 'y'
 
     def exists(self, name: str) -> bool:
         """
@@ -189,14 +250,11 @@ class ModelManager:
             >>> if models.exists("detector-v1"):
             ...     print("Model exists")
         """
-        from ..core.registries import ModelRegistry
-
-        registry = ModelRegistry(self._project_path)
-        return registry.get_model(name) is not None
+        return self._model_registry.exists_model(name)
 
     def __len__(self) -> int:
         """Number of promoted models."""
-        return len(self.list())
+        return self._model_registry.count_models()
 
     def __iter__(self):
         """Iterate over promoted models."""
@@ -4,9 +4,12 @@ ModelCub SDK - Project Management.
 Provides high-level Python API for project operations.
 """
 from __future__ import annotations
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional, List, Any
-import shutil
+from typing import Optional, List, Any, Dict, Iterable, Tuple
+import os
+import time
 
 from ..services.project_service import (
     init_project,
@@ -14,13 +17,71 @@ from ..services.project_service import (
     InitProjectRequest,
     DeleteProjectRequest
 )
+from ..services import image_service
 from ..core.config import Config, load_config, save_config
 from ..core.registries import DatasetRegistry, RunRegistry
-from ..core.paths import project_root
+from ..core.paths import clear_project_root_cache, project_root, resolve_path
+from ..core.io_utils import delete_tree_in_background, sweep_trash
 from .dataset import Dataset
+from .job import JobManager
 from .training_run import TrainingManager
 from .model_manager import ModelManager
 
+# Short-lived memo of project marker checks: "exists() then load()" would
+# otherwise stat the same marker file several times in a row.
+_EXISTS_TTL = 0.5
+# config.yaml can only exist inside .modelcub/, so one stat covers both markers
+_CONFIG_REL = os.path.join(".modelcub", "config.yaml")
+_EXISTS_CACHE: Dict[Path, Tuple[float, bool]] = {}
+
+
+def _project_markers_present(path: Path) -> bool:
+    """Check for .modelcub/config.yaml, reusing a result younger than _EXISTS_TTL."""
+    now = time.monotonic()
+    hit = _EXISTS_CACHE.get(path)
+    if hit is not None and now - hit[0] < _EXISTS_TTL:
+        return hit[1]
+
+    if len(_EXISTS_CACHE) > 128:
+        _EXISTS_CACHE.clear()
+
+    present = os.path.exists(os.path.join(path, _CONFIG_REL))
+    _EXISTS_CACHE[path] = (now, present)
+    return present
+
+
+@lru_cache(maxsize=256)
+def _config_getter(path: str) -> attrgetter:
+    """Compiled attribute chain for a dot-separated config path."""
+    return attrgetter(path)
+
+
+def _parse_classes(classes: Optional[str | Iterable[str]]) -> Optional[List[str]]:
+    """Normalize classes given as a comma-separated string or any iterable."""
+    if classes is None or isinstance(classes, list):
+        return classes
+    if isinstance(classes, str):
+        return list(filter(None, (c.strip() for c in classes.split(","))))
+    return list(classes)
+
+
+class _cached_path:
+    """cached_property for Project's path properties, stored in its _path_cache slot."""
+
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        cache = obj._path_cache
+        try:
+            return cache[self.name]
+        except KeyError:
+            value = cache[self.name] = self.func(obj)
+            return value
 
 
 class Project:
@@ -33,21 +94,58 @@ class Project:
         >>> datasets = project.list_datasets()
     """
 
+    __slots__ = (
+        "path",
+        "_config",
+        "_config_dirty",
+        "_dataset_registry",
+        "_run_registry",
+        "_training_manager",
+        "_model_manager",
+        "_path_cache",
+    )
+
     def __init__(self, path: str | Path):
         """Initialize Project by loading from path."""
-        self.path = Path(path).resolve()
+        self._setup(resolve_path(path))
+
+    @classmethod
+    def _from_resolved(cls, path: Path) -> Project:
+        """Build a Project from a path that has already been resolved."""
+        project = cls.__new__(cls)
+        project._setup(path)
+        return project
+
+    def _setup(self, path: Path) -> None:
+        self.path = path
+        self._path_cache: Dict[str, Path] = {}
         self._training_manager = None
         self._model_manager = None
+        self._dataset_registry: Optional[DatasetRegistry] = None
+        self._run_registry: Optional[RunRegistry] = None
 
         if not self._is_valid_project(self.path):
             raise ValueError(f"Not a valid ModelCub project: {self.path}")
 
-        self._config = load_config(self.path)
+        # Parsed on first access to .config (see the config property)
+        self._config: Optional[Config] = None
+        self._config_dirty = False
+
+        # Finish off deletes an earlier process didn't get to complete
+        sweep_trash(self.path / ".modelcub" / "trash")
 
     @staticmethod
     def _is_valid_project(path: Path) -> bool:
         """Check if directory is a valid ModelCub project."""
-        return (path / ".modelcub").exists() and (path / ".modelcub" / "config.yaml").exists()
+        return _project_markers_present(path)
+
+    @staticmethod
+    def invalidate_exists_cache(path: Optional[str | Path] = None) -> None:
+        """Forget memoized existence checks for path (or for every path)."""
+        if path is None:
+            _EXISTS_CACHE.clear()
+        else:
+            _EXISTS_CACHE.pop(resolve_path(path), None)
 
     # ========== Static Methods ==========
 
@@ -73,8 +171,7 @@ class Project:
             >>> project = Project.init("my-cv-project")
             >>> project = Project.init("detection", path="/workspace/proj")
         """
-        target_path = Path(path) if path else Path.cwd() / name
-        target_path = target_path.resolve()
+        target_path = resolve_path(path if path else Path.cwd() / name)
 
         req = InitProjectRequest(
             path=str(target_path),
@@ -83,11 +180,14 @@ class Project:
         )
 
         result = init_project(req)
+        cls.invalidate_exists_cache(target_path)
+        # A new project may now be the nearest root for a cached cwd
+        clear_project_root_cache()
 
         if not result.success:
             raise RuntimeError(f"Failed to initialize project: {result.message}")
 
-        return cls(target_path)
+        return cls._from_resolved(target_path)
 
     @classmethod
     def load(cls, path: Optional[str | Path] = None) -> Project:
@@ -104,12 +204,9 @@ class Project:
             >>> project = Project.load()
             >>> project = Project.load("/path/to/project")
         """
-        if path is None:
-            path = project_root()
-        else:
-            path = Path(path).resolve()
-
-        return cls(path)
+        # project_root() already returns a resolved path
+        resolved = project_root() if path is None else resolve_path(path)
+        return cls._from_resolved(resolved)
 
     @staticmethod
     def exists(path: str | Path = ".") -> bool:
@@ -126,35 +223,38 @@ class Project:
             >>> if Project.exists("./my-project"):
             ...     project = Project.load("./my-project")
         """
-        path = Path(path).resolve()
-        return (path / ".modelcub").exists() and (path / ".modelcub" / "config.yaml").exists()
+        return _project_markers_present(resolve_path(path))
 
     # ========== Properties ==========
 
     @property
     def name(self) -> str:
         """Project name."""
-        return self._config.project.name
+        return self.config.project.name
 
     @property
     def created(self) -> str:
         """Project creation timestamp."""
-        return self._config.project.created
+        return self.config.project.created
 
     @property
     def version(self) -> str:
         """Project version."""
-        return self._config.project.version
+        return self.config.project.version
 
     @property
     def config(self) -> Config:
-        """Project configuration."""
+        """Project configuration (loaded from disk on first access)."""
+        if self._config is None:
+            self._config = load_config(self.path)
         return self._config
 
     @property
     def datasets(self) -> DatasetRegistry:
         """Dataset registry."""
-        return DatasetRegistry(self.path)
+        if self._dataset_registry is None:
+            self._dataset_registry = DatasetRegistry(self.path)
+        return self._dataset_registry
 
     @property
     def training(self) -> TrainingManager:
@@ -192,65 +292,82 @@ class Project:
     @property
     def runs(self) -> RunRegistry:
         """Training runs registry."""
-        return RunRegistry(self.path)
+        if self._run_registry is None:
+            self._run_registry = RunRegistry(self.path)
+        return self._run_registry
 
     # ========== Path Properties ==========
 
-    @property
+    @_cached_path
     def modelcub_dir(self) -> Path:
         """Path to .modelcub directory."""
         return self.path / ".modelcub"
 
-    @property
+    @_cached_path
     def data_dir(self) -> Path:
         """Path to data directory."""
-        return self.path / self._config.paths.data
+        return self.path / self.config.paths.data
 
-    @property
+    @_cached_path
     def datasets_dir(self) -> Path:
         """Path to datasets directory."""
         return self.data_dir / "datasets"
 
-    @property
+    @_cached_path
     def runs_dir(self) -> Path:
         """Path to runs directory."""
-        return self.path / self._config.paths.runs
+        return self.path / self.config.paths.runs
 
-    @property
+    @_cached_path
     def reports_dir(self) -> Path:
         """Path to reports directory."""
-        return self.path / self._config.paths.reports
+        return self.path / self.config.paths.reports
 
-    @property
+    @_cached_path
     def cache_dir(self) -> Path:
         """Path to cache directory."""
         return self.modelcub_dir / "cache"
 
-    @property
+    @_cached_path
     def backups_dir(self) -> Path:
         """Path to backups directory."""
         return self.modelcub_dir / "backups"
 
-    @property
+    @_cached_path
     def history_dir(self) -> Path:
         """Path to history directory."""
         return self.modelcub_dir / "history"
 
     @property
-    def jobs(self) -> 'JobManager':
+    def jobs(self) -> JobManager:
         """Job manager for this project."""
-        from .job import JobManager
         return JobManager(self.path)
 
     # ========== Config Methods ==========
 
     def save_config(self) -> None:
         """Save current configuration to disk."""
-        save_config(self.path, self._config)
+        config = self.config
+        if config is None:
+            raise ValueError(f"No configuration to save for project: {self.path}")
+        save_config(self.path, config)
+        self._config_dirty = False
 
     def reload_config(self) -> None:
         """Reload configuration from disk."""
         self._config = load_config(self.path)
+        self._config_dirty = False
+        self._clear_path_cache()
+
+    def reload_registries(self) -> None:
+        """Drop the cached registry objects so the next access rebuilds them."""
+        self._dataset_registry = None
+        self._run_registry = None
+        self._clear_path_cache()
+
+    def _clear_path_cache(self) -> None:
+        """Forget cached path properties so they are recomputed from the config."""
+        self._path_cache.clear()
 
     def get_config(self, path: str, default: Any = None) -> Any:
         """
@@ -269,16 +386,10 @@ class Project:
             >>> project.get_config("foo.bar", "fallback")
             'fallback'
         """
-        parts = path.split(".")
-        value = self._config
-
-        for part in parts:
-            if hasattr(value, part):
-                value = getattr(value, part)
-            else:
-                return default
-
-        return value
+        try:
+            return _config_getter(path)(self.config)
+        except AttributeError:
+            return default
 
     def set_config(self, path: str, value: Any) -> None:
         """
@@ -295,22 +406,22 @@ class Project:
             >>> project.set_config("defaults.batch_size", 64)
             >>> project.save_config()
         """
-        parts = path.split(".")
-        if len(parts) < 2:
+        parent_path, _, final_attr = path.rpartition(".")
+        if not parent_path:
             raise ValueError(f"Invalid config path: {path}")
 
-        obj = self._config
-        for part in parts[:-1]:
-            if hasattr(obj, part):
-                obj = getattr(obj, part)
-            else:
-                raise ValueError(f"Invalid config path: {path}")
+        try:
+            obj = _config_getter(parent_path)(self.config)
+        except AttributeError:
+            raise ValueError(f"Invalid config path: {path}") from None
 
-        final_attr = parts[-1]
         if not hasattr(obj, final_attr):
             raise ValueError(f"Invalid config path: {path}")
 
         setattr(obj, final_attr, value)
+        self._config_dirty = True
+        if parent_path == "paths":
+            self._clear_path_cache()
 
     # ========== Project Operations ==========
 
@@ -337,6 +448,8 @@ class Project:
         )
 
         result = delete_project(req)
+        self.invalidate_exists_cache(self.path)
+        clear_project_root_cache()
 
         if not result.success:
             raise RuntimeError(f"Failed to delete project: {result.message}")
@@ -378,43 +491,100 @@ class Project:
             ...     delete_existent=True
             ... )
         """
-        from ..services.image_service import import_images, ImportImagesRequest
-
-        # Delete existing dataset if requested
-        if delete_existent and name:
-            dataset_path = self.datasets_dir / name
-            if dataset_path.exists():
-                import shutil
-                shutil.rmtree(dataset_path)
-
-                # Remove from registry
-                registry = DatasetRegistry(self.path)
-                try:
-                    registry.remove_dataset(name)
-                except:
-                    pass  # Ignore if not in registry
-
-        # Parse classes from string if needed
-        if isinstance(classes, str):
-            classes = [c.strip() for c in classes.split(",") if c.strip()]
-
-        req = ImportImagesRequest(
+        req, clear = self._import_request(
+            source, name, classes, recursive, copy, validate, force, delete_existent
+        )
+        if clear and self._clear_dataset_dir(name):
+            # Remove from registry
+            try:
+                self.datasets.remove_dataset(name)
+            except:
+                pass  # Ignore if not in registry
+
+        result = image_service.import_images(req)
+
+        if not result.success:
+            raise ValueError(result.message)
+
+        return Dataset(result.dataset_name, project_path=self.path)
+
+    def import_datasets(self, specs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Import several datasets, registering them with a single registry write.
+
+        Args:
+            specs: One dict per dataset, with the keyword arguments of
+                import_dataset (``source`` is required)
+
+        Returns:
+            Dict with ``success`` (Dataset instances) and ``failed``
+            (``{"source", "name", "error"}`` entries), in input order
+
+        Example:
+            >>> result = project.import_datasets([
+            ...     {"source": "./cats", "name": "cats", "classes": ["cat"]},
+            ...     {"source": "./dogs", "name": "dogs", "classes": ["dog"]},
+            ... ])
+            >>> [d.name for d in result["success"]]
+            ['cats', 'dogs']
+        """
+        # Build every request before touching disk, so a bad spec fails
+        # the call before any existing dataset is cleared out
+        staged = [self._import_request(**spec) for spec in specs]
+        reqs = [req for req, _ in staged]
+
+        # Cleared datasets leave the registry in the same write that adds
+        # the imported ones
+        cleared = [
+            req.dataset_name for req, clear in staged
+            if clear and self._clear_dataset_dir(req.dataset_name)
+        ]
+        results = image_service.import_images_batch(reqs, remove_names=cleared)
+
+        failed = [
+            {"source": str(req.source), "name": req.dataset_name, "error": result.message}
+            for req, result in zip(reqs, results)
+            if not result.success
+        ]
+        names = [result.dataset_name for result in results if result.success]
+        success = self.get_datasets(names) if names else []
+
+        return {"success": success, "failed": failed}
+
+    def _import_request(
+        self,
+        source: str | Path,
+        name: Optional[str] = None,
+        classes: Optional[List[str]] = None,
+        recursive: bool = False,
+        copy: bool = True,
+        validate: bool = True,
+        force: bool = False,
+        delete_existent: bool = False
+    ) -> Tuple[image_service.ImportImagesRequest, bool]:
+        """Build an import request, and whether an existing dataset should be cleared first."""
+        req = image_service.ImportImagesRequest(
             project_path=self.path,
             source=Path(source),
             dataset_name=name,
-            classes=classes,
+            classes=_parse_classes(classes),
             copy=copy,
             validate=validate,
             recursive=recursive,
             force=force
         )
+        return req, bool(delete_existent and name)
 
-        result = import_images(req)
-
-        if not result.success:
-            raise ValueError(result.message)
+    def _clear_dataset_dir(self, name: str) -> bool:
+        """Move an existing dataset directory out of the way; True if there was one."""
+        dataset_path = self.datasets_dir / name
+        if not dataset_path.exists():
+            return False
 
-        return Dataset(result.dataset_name, project_path=self.path)
+        # Rename out of the way now; the tree is reaped off-thread,
+        # and the process waits for that to finish before exiting
+        delete_tree_in_background(dataset_path, self.modelcub_dir / "trash")
+        return True
 
     def list_datasets(self) -> List[Dataset]:
         """
@@ -427,16 +597,13 @@ class Project:
             >>> for dataset in project.list_datasets():
             ...     print(dataset.name, dataset.images)
         """
-        registry = DatasetRegistry(self.path)
-        dataset_list = registry.list_datasets()
+        registry = self.datasets
 
         datasets = []
-        for ds_dict in dataset_list:
-            try:
-                dataset = Dataset(ds_dict["name"], project_path=self.path)
-                datasets.append(dataset)
-            except Exception:
+        for ds_dict in registry.list_datasets():
+            if not ds_dict.get("name"):
                 continue
+            datasets.append(Dataset._from_preloaded(ds_dict, self.path, registry))
 
         return datasets
 
@@ -456,13 +623,35 @@ class Project:
         Example:
             >>> dataset = project.get_dataset("animals-v1")
         """
-        registry = DatasetRegistry(self.path)
+        registry = self.datasets
         ds_dict = registry.get_dataset(name)
 
         if not ds_dict:
             raise ValueError(f"Dataset not found: {name}")
 
-        return Dataset(name, project_path=self.path)
+        return Dataset._from_preloaded(ds_dict, self.path, registry)
+
+    def get_datasets(self, names: List[str]) -> List[Dataset]:
+        """
+        Get several datasets by name with a single registry lookup.
+
+        Args:
+            names: Dataset names
+
+        Returns:
+            Dataset instances, in the order of names
+
+        Raises:
+            DatasetNotFoundError: If any dataset is not found
+
+        Example:
+            >>> train, holdout = project.get_datasets(["animals-v1", "animals-v2"])
+        """
+        registry = self.datasets
+        return [
+            Dataset._from_preloaded(ds_dict, self.path, registry)
+            for ds_dict in registry.get_datasets(names)
+        ]
 
     # ========== Context Manager ==========
 
@@ -470,14 +659,25 @@ class Project:
         """Enter context manager."""
         return self
 
+    def mark_config_dirty(self) -> None:
+        """Flag the config as modified after mutating ``project.config`` directly."""
+        self._config_dirty = True
+
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Exit context manager - auto-save config."""
-        self.save_config()
+        """Exit context manager - save config if it was modified and no error occurred."""
+        if exc_type is None and self._config_dirty:
+            self.save_config()
 
     # ========== String Representations ==========
 
+    def _display_name(self) -> str:
+        """Project name for display, without forcing a config load."""
+        if self._config is not None:
+            return self._config.project.name
+        return self.path.name
+
     def __repr__(self) -> str:
-        return f"Project(name='{self.name}', path='{self.path}')"
+        return f"Project(name='{self._display_name()}', path='{self.path}')"
 
     def __str__(self) -> str:
-        return f"ModelCub Project: {self.name}"
\ No newline at end of file
+        return f"ModelCub Project: {self._display_name()}"
\ No newline at end of file
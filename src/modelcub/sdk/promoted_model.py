@@ -4,9 +4,16 @@ ModelCub SDK - Promoted Model Management.
 Provides high-level Python API for working with promoted models.
 """
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Callable
-import shutil
+from queue import Queue
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Callable, Iterable, Mapping
+import os
+import sys
+
+from ..core.paths import resolve_path
 
 
 class InferenceResult:
@@ -14,17 +21,25 @@ class InferenceResult:
     Result from an inference operation.
 
     Attributes:
-        inference_id: Unique inference job ID
+        inference_id: Unique inference job ID (None for in-memory predictions)
         stats: Dictionary with inference statistics
-        output_path: Path to inference results
+        output_path: Path to inference results (None when nothing was saved)
         detections: List of detections (if available)
     """
 
-    def __init__(self, inference_id: str, stats: Dict[str, Any], output_path: Path):
+    __slots__ = ("inference_id", "stats", "output_path", "_detections")
+
+    def __init__(
+        self,
+        inference_id: Optional[str],
+        stats: Dict[str, Any],
+        output_path: Optional[Path],
+        detections: Optional[List[Any]] = None
+    ):
         self.inference_id = inference_id
         self.stats = stats
         self.output_path = output_path
-        self._detections = None
+        self._detections = detections
 
     @property
     def total_images(self) -> int:
@@ -41,6 +56,11 @@ class InferenceResult:
         """Average inference time in milliseconds."""
         return self.stats.get('avg_inference_time_ms', 0.0)
 
+    @property
+    def detections(self) -> Optional[List[Any]]:
+        """Detections, when the prediction ran in memory (None otherwise)."""
+        return self._detections
+
     @property
     def classes_detected(self) -> List[str]:
         """List of class names detected."""
@@ -55,6 +75,32 @@ class InferenceResult:
         )
 
 
+class SpecializedPredictor:
+    """
+    In-memory single-image predictor bound to fixed settings.
+
+    Created by PromotedModel.specialize(); hold on to it across frames
+    instead of calling predict_image with the same arguments each time.
+    """
+
+    __slots__ = ("_predict", "_root", "_summarize")
+
+    def __init__(self, predict: Callable[[Path], Any], root: Path):
+        from ..services.inference.inference_service import summarize_predictions
+
+        self._predict = predict
+        self._root = root
+        self._summarize = summarize_predictions
+
+    def __call__(self, image_path: str | Path) -> InferenceResult:
+        path = Path(image_path)
+        if not path.is_absolute():
+            path = self._root / path
+        prediction = self._predict(path)
+        stats = self._summarize([prediction])
+        return InferenceResult(None, stats, None, detections=prediction.detections)
+
+
 class PromotedModel:
     """
     High-level interface for a promoted model.
@@ -67,6 +113,21 @@ class PromotedModel:
         >>> print(f"Found {result.total_detections} objects")
     """
 
+    __slots__ = (
+        "name",
+        "version",
+        "run_id",
+        "created",
+        "path",
+        "_project_path",
+        "_data",
+        "_metadata",
+        "_adapter",
+        "_adapter_device",
+        "_registry_stamp",
+        "_inference_service",
+    )
+
     def __init__(self, name: str, project_path: str | Path):
         """
         Initialize PromotedModel.
@@ -76,71 +137,136 @@ class PromotedModel:
             project_path: Project directory path
         """
         self.name = name
-        self._project_path = Path(project_path).resolve()
+        self._project_path = resolve_path(project_path)
         self._data = None
+        self._adapter = None
+        self._adapter_device: Optional[str] = None
+        self._registry_stamp: Optional[tuple] = None
+        self._inference_service = None
         self._load_data()
 
+    @classmethod
+    def _from_preloaded(cls, data: Dict[str, Any], project_path: Path) -> PromotedModel:
+        """Build a PromotedModel from an already-loaded registry entry without any I/O."""
+        model = cls.__new__(cls)
+        model.name = data['name']
+        model._project_path = project_path
+        model._bind(data)
+        model._adapter = None
+        model._adapter_device = None
+        model._registry_stamp = None
+        model._inference_service = None
+        return model
+
     def _load_data(self) -> None:
         """Load model data from registry."""
         from ..core.registries import ModelRegistry
 
         registry = ModelRegistry(self._project_path)
-        self._data = registry.get_model(self.name)
+        # Stat before parsing: a write in between leaves an older stamp, so
+        # the next reload() re-reads rather than missing it
+        self._registry_stamp = self._stat_registry(registry.registry_path)
+        data = registry.get_model(self.name)
 
-        if self._data is None:
+        if data is None:
             raise ValueError(f"Model not found: {self.name}")
+        self._bind(data)
+
+    def _bind(self, data: Dict[str, Any]) -> None:
+        """Take a registry entry and copy its fixed fields into plain attributes."""
+        self._data = data
+        self._metadata = data.setdefault('metadata', {})
+        # version, run_id, created and path are read on every info()/repr
+        # and by callers' loops; plain slots skip the dict lookups
+        self.version: str = data['version']
+        self.run_id: str = data['run_id']
+        self.created: str = data['created']
+        self.path: Path = self._project_path / data['path']
+
+    @staticmethod
+    def _stat_registry(path: Path) -> Optional[tuple]:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def reload(self) -> None:
+        """
+        Reload model data from registry and drop the cached weights.
 
-    # ========== Properties ==========
-
-    @property
-    def version(self) -> str:
-        """Model version identifier."""
-        return self._data['version']
+        Does nothing when models.yaml is unchanged since the last load.
+        """
+        from ..core.registries import ModelRegistry
 
-    @property
-    def run_id(self) -> str:
-        """Training run that produced this model."""
-        return self._data['run_id']
+        path = ModelRegistry(self._project_path).registry_path
+        stamp = self._registry_stamp
+        if stamp is not None and stamp == self._stat_registry(path):
+            return
 
-    @property
-    def created(self) -> str:
-        """ISO timestamp when model was promoted."""
-        return self._data['created']
+        self._load_data()
+        self._adapter = None
+        self._adapter_device = None
+        self._inference_service = None
+
+    def _input_path(self, path: str | Path) -> Path:
+        """Resolve an inference input like InferenceService does (relative to the project)."""
+        path = Path(path)
+        return path if path.is_absolute() else self._project_path / path
+
+    def _svc(self):
+        """InferenceService for this project, built once and reused across predict calls."""
+        if self._inference_service is None:
+            from ..services.inference import InferenceService
+            self._inference_service = InferenceService(self._project_path)
+        return self._inference_service
+
+    def _get_adapter(self, device: Optional[str]):
+        """Inference adapter with these weights loaded, reused across predict calls."""
+        if device is None:
+            from ..services.inference.inference_yolo import default_device
+            device = default_device()
+
+        if self._adapter is None or self._adapter_device != device:
+            from ..services.inference.inference_yolo import YOLOInferenceAdapter
+
+            adapter = YOLOInferenceAdapter()
+            adapter.load_model(self.path, device=device)
+            self._adapter = adapter
+            self._adapter_device = device
+        return self._adapter
 
-    @property
-    def path(self) -> Path:
-        """Path to model weights file."""
-        return self._project_path / self._data['path']
+    # ========== Properties ==========
 
     @property
-    def metadata(self) -> Dict[str, Any]:
-        """Model metadata (metrics, description, tags, etc.)."""
-        return self._data['metadata'].copy()
+    def metadata(self) -> Mapping[str, Any]:
+        """Model metadata (metrics, description, tags, etc.), as a read-only view."""
+        return MappingProxyType(self._metadata)
 
     @property
     def description(self) -> str:
         """Model description."""
-        return self.metadata.get('description', '')
+        return self._metadata.get('description', '')
 
     @property
     def tags(self) -> List[str]:
         """Model tags."""
-        return self.metadata.get('tags', [])
+        return self._metadata.get('tags', [])
 
     @property
     def metrics(self) -> Dict[str, Any]:
         """Training metrics."""
-        return self.metadata.get('metrics', {})
+        return self._metadata.get('metrics', {})
 
     @property
     def config(self) -> Dict[str, Any]:
         """Training configuration used."""
-        return self.metadata.get('config', {})
+        return self._metadata.get('config', {})
 
     @property
     def dataset_name(self) -> str:
         """Dataset used for training."""
-        return self.metadata.get('dataset_name', '')
+        return self._metadata.get('dataset_name', '')
 
     @property
     def map50(self) -> Optional[float]:
@@ -159,7 +285,7 @@ class PromotedModel:
         image_path: str | Path,
         conf: float = 0.25,
         iou: float = 0.45,
-        device: str = "cpu",
+        device: Optional[str] = None,
         save_txt: bool = True,
         save_img: bool = False,
         classes: Optional[List[int]] = None,
@@ -172,23 +298,42 @@ class PromotedModel:
             image_path: Path to image file
             conf: Confidence threshold (0-1)
             iou: IoU threshold for NMS (0-1)
-            device: Device to use (cpu, cuda, cuda:0, mps)
+            device: Device to use (cpu, cuda, cuda:0, mps); defaults to the
+                first CUDA device when available, else cpu
             save_txt: Save YOLO format labels
             save_img: Save annotated image
             classes: Filter specific class IDs
             progress_callback: Optional callback(current, total, message)
 
         Returns:
-            InferenceResult with statistics and output path
+            InferenceResult with statistics and output path. With
+            save_txt=False, save_img=False and no progress_callback the
+            image is predicted in memory: no inference job is recorded and
+            inference_id/output_path are None.
 
         Example:
             >>> result = model.predict_image("test.jpg", conf=0.5)
             >>> print(f"Found {result.total_detections} objects")
             >>> print(f"Results saved to: {result.output_path}")
         """
-        from ..services.inference import InferenceService
-
-        service = InferenceService(self._project_path)
+        # Load (or reuse) the weights before creating a job, so a load
+        # failure doesn't leave a pending job behind
+        adapter = self._get_adapter(device)
+        device = self._adapter_device
+
+        if not save_txt and not save_img and progress_callback is None:
+            # Nothing to persist: skip the job registry and output directory
+            from ..services.inference.inference_service import summarize_predictions
+
+            prediction = adapter.predict_image(
+                self._input_path(image_path),
+                conf_threshold=conf,
+                iou_threshold=iou,
+                classes=classes
+            )
+            stats = summarize_predictions([prediction])
+            return InferenceResult(None, stats, None, detections=prediction.detections)
+        service = self._svc()
 
         # Create inference job
         inference_id = service.create_inference_job(
@@ -204,7 +349,9 @@ class PromotedModel:
         )
 
         # Run inference
-        stats = service.run_inference(inference_id, progress_callback=progress_callback)
+        stats = service.run_inference(
+            inference_id, progress_callback=progress_callback, adapter=adapter
+        )
 
         # Get output path
         job = service.inference_registry.get_inference(inference_id)
@@ -217,7 +364,7 @@ class PromotedModel:
         directory: str | Path,
         conf: float = 0.25,
         iou: float = 0.45,
-        device: str = "cpu",
+        device: Optional[str] = None,
         batch_size: int = 16,
         save_txt: bool = True,
         save_img: bool = False,
@@ -231,7 +378,8 @@ class PromotedModel:
             directory: Path to directory containing images
             conf: Confidence threshold (0-1)
             iou: IoU threshold for NMS (0-1)
-            device: Device to use (cpu, cuda, cuda:0, mps)
+            device: Device to use (cpu, cuda, cuda:0, mps); defaults to the
+                first CUDA device when available, else cpu
             batch_size: Batch size for processing
             save_txt: Save YOLO format labels
             save_img: Save annotated images
@@ -239,16 +387,42 @@ class PromotedModel:
             progress_callback: Optional callback(current, total, message)
 
         Returns:
-            InferenceResult with statistics and output path
+            InferenceResult with statistics and output path. As with
+            predict_image, skipping all outputs runs the batches in memory
+            without recording an inference job.
 
         Example:
             >>> result = model.predict_images("test_images/", batch_size=32)
             >>> print(f"Processed {result.total_images} images")
             >>> print(f"Found {result.total_detections} total detections")
         """
-        from ..services.inference import InferenceService
-
-        service = InferenceService(self._project_path)
+        # Load (or reuse) the weights before creating a job, so a load
+        # failure doesn't leave a pending job behind
+        adapter = self._get_adapter(device)
+        device = self._adapter_device
+
+        if not save_txt and not save_img and progress_callback is None:
+            from ..services.inference.inference_service import (
+                collect_images,
+                summarize_predictions
+            )
+
+            images = collect_images('images', self._input_path(directory))
+            if not images:
+                raise ValueError(f"No images found in: {directory}")
+
+            predictions = adapter.predict_batch(
+                image_paths=images,
+                conf_threshold=conf,
+                iou_threshold=iou,
+                classes=classes,
+                batch_size=batch_size
+            )
+            detections = [d for p in predictions for d in p.detections]
+            return InferenceResult(
+                None, summarize_predictions(predictions), None, detections=detections
+            )
+        service = self._svc()
 
         # Create inference job
         inference_id = service.create_inference_job(
@@ -265,7 +439,9 @@ class PromotedModel:
         )
 
         # Run inference
-        stats = service.run_inference(inference_id, progress_callback=progress_callback)
+        stats = service.run_inference(
+            inference_id, progress_callback=progress_callback, adapter=adapter
+        )
 
         # Get output path
         job = service.inference_registry.get_inference(inference_id)
@@ -279,7 +455,7 @@ class PromotedModel:
         split: str = 'val',
         conf: float = 0.25,
         iou: float = 0.45,
-        device: str = "cpu",
+        device: Optional[str] = None,
         batch_size: int = 16,
         save_txt: bool = True,
         save_img: bool = False,
@@ -293,7 +469,8 @@ class PromotedModel:
             split: Dataset split (train, val, test)
             conf: Confidence threshold (0-1)
             iou: IoU threshold for NMS (0-1)
-            device: Device to use (cpu, cuda, cuda:0, mps)
+            device: Device to use (cpu, cuda, cuda:0, mps); defaults to the
+                first CUDA device when available, else cpu
             batch_size: Batch size for processing
             save_txt: Save YOLO format labels
             save_img: Save annotated images
@@ -307,18 +484,22 @@ class PromotedModel:
             >>> print(f"Processed {result.total_images} images")
             >>> print(f"Classes detected: {result.classes_detected}")
         """
-        from ..services.inference import InferenceService
+        from ..core.exceptions import DatasetNotFoundError
         from ..core.registries import DatasetRegistry
 
-        # Validate dataset exists
-        dataset_registry = DatasetRegistry(self._project_path)
-        if not dataset_registry.exists(dataset_name):
-            raise ValueError(f"Dataset not found: {dataset_name}")
+        # One lookup both validates the dataset and gives its recorded path
+        try:
+            info = DatasetRegistry(self._project_path).get_dataset(dataset_name)
+        except DatasetNotFoundError:
+            raise ValueError(f"Dataset not found: {dataset_name}") from None
 
-        # Get dataset path
-        dataset_path = self._project_path / "data" / "datasets" / dataset_name
+        dataset_path = self._project_path / (info.get("path") or f"data/datasets/{dataset_name}")
 
-        service = InferenceService(self._project_path)
+        # Load (or reuse) the weights before creating a job, so a load
+        # failure doesn't leave a pending job behind
+        adapter = self._get_adapter(device)
+        device = self._adapter_device
+        service = self._svc()
 
         # Create inference job
         inference_id = service.create_inference_job(
@@ -334,7 +515,9 @@ class PromotedModel:
         )
 
         # Run inference
-        stats = service.run_inference(inference_id, progress_callback=progress_callback)
+        stats = service.run_inference(
+            inference_id, progress_callback=progress_callback, adapter=adapter
+        )
 
         # Get output path
         job = service.inference_registry.get_inference(inference_id)
@@ -342,6 +525,122 @@ class PromotedModel:
 
         return InferenceResult(inference_id, stats, output_path)
 
+    def predict_concurrent(
+        self,
+        sources: Iterable[str | Path],
+        conf: float = 0.25,
+        iou: float = 0.45,
+        device: Optional[str] = None,
+        classes: Optional[List[int]] = None,
+        max_workers: int = 4
+    ) -> List[InferenceResult]:
+        """
+        Predict several single images at once, e.g. the latest frame from
+        each of several cameras.
+
+        Each worker thread gets its own predictor for this call, all on
+        the one loaded network, so no weights are loaded or held twice.
+        Predictions are in memory, as in predict_image with no outputs.
+
+        Args:
+            sources: Image paths, one result per path
+            conf: Confidence threshold (0-1)
+            iou: IoU threshold for NMS (0-1)
+            device: Device to use (same default as predict_*)
+            classes: Filter specific class IDs
+            max_workers: Maximum number of images predicted in parallel
+
+        Returns:
+            InferenceResults in the order of sources
+
+        Example:
+            >>> results = model.predict_concurrent(["cam0.jpg", "cam1.jpg"])
+            >>> print([r.total_detections for r in results])
+        """
+        from ..services.inference.inference_service import summarize_predictions
+
+        paths = [self._input_path(source) for source in sources]
+        if not paths:
+            return []
+
+        workers = max(1, min(max_workers, len(paths)))
+        idle: Queue = Queue()
+        # Per-call adapters: overlapping calls never share a predictor, and
+        # nothing beyond the primary adapter outlives the call
+        primary = self._get_adapter(device)
+        for _ in range(workers):
+            idle.put(primary.share())
+
+        def predict(path: Path) -> InferenceResult:
+            adapter = idle.get()
+            try:
+                prediction = adapter.predict_image(
+                    path, conf_threshold=conf, iou_threshold=iou, classes=classes
+                )
+            finally:
+                idle.put(adapter)
+            stats = summarize_predictions([prediction])
+            return InferenceResult(None, stats, None, detections=prediction.detections)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(predict, paths))
+
+    def specialize(
+        self,
+        conf: float = 0.25,
+        iou: float = 0.45,
+        device: Optional[str] = None,
+        classes: Optional[List[int]] = None
+    ) -> SpecializedPredictor:
+        """
+        Bind inference settings once for repeated single-image predictions.
+
+        The weights are loaded now and the settings are bound into the
+        returned predictor, so each call only runs the prediction. Images
+        are predicted in memory, as in predict_image with no outputs.
+
+        Args:
+            conf: Confidence threshold (0-1)
+            iou: IoU threshold for NMS (0-1)
+            device: Device to use (same default as predict_*)
+            classes: Filter specific class IDs
+
+        Returns:
+            Callable taking an image path and returning an InferenceResult
+
+        Example:
+            >>> predict = model.specialize(conf=0.5, device="cuda")
+            >>> for frame in frames:
+            ...     print(predict(frame).total_detections)
+        """
+        adapter = self._get_adapter(device)
+        return SpecializedPredictor(partial(
+            adapter.predict_image,
+            conf_threshold=conf,
+            iou_threshold=iou,
+            classes=classes
+        ), self._project_path)
+
+    def warmup(self, imgsz: int = 640, device: Optional[str] = None, runs: int = 2) -> None:
+        """
+        Load the weights and run dummy inferences ahead of real traffic.
+
+        The first prediction on a fresh model pays for weight loading and
+        backend initialization; calling this up front moves that cost out
+        of the first user-facing predict call.
+
+        Args:
+            imgsz: Side length of the square dummy image
+            device: Device to warm up (must match later predict calls;
+                same default as predict_*)
+            runs: Number of dummy forward passes
+
+        Example:
+            >>> model.warmup(device="cuda")
+            >>> result = model.predict_image("test.jpg", device="cuda")
+        """
+        self._get_adapter(device).warmup(imgsz=imgsz, runs=runs)
+
     # ========== Utility Methods ==========
 
     def info(self) -> None:
@@ -351,29 +650,32 @@ class PromotedModel:
         Example:
             >>> model.info()
         """
-        print(f"Model: {self.name}")
-        print(f"Version: {self.version}")
-        print(f"Created: {self.created}")
-        print(f"Run: {self.run_id}")
-        print(f"Path: {self.path}")
-        print()
+        lines = [
+            f"Model: {self.name}",
+            f"Version: {self.version}",
+            f"Created: {self.created}",
+            f"Run: {self.run_id}",
+            f"Path: {self.path}",
+            "",
+        ]
 
         if self.description:
-            print(f"Description: {self.description}")
-            print()
+            lines += [f"Description: {self.description}", ""]
 
         if self.tags:
-            print(f"Tags: {', '.join(self.tags)}")
-            print()
+            lines += [f"Tags: {', '.join(self.tags)}", ""]
 
-        if self.metrics:
-            print("Metrics:")
-            for key, value in self.metrics.items():
-                print(f"  {key}: {value}")
-            print()
+        metrics = self.metrics
+        if metrics:
+            lines.append("Metrics:")
+            lines.extend(f"  {key}: {value}" for key, value in metrics.items())
+            lines.append("")
 
         if self.dataset_name:
-            print(f"Dataset: {self.dataset_name}")
+            lines.append(f"Dataset: {self.dataset_name}")
+
+        # One write instead of a print() per line
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def delete(self, force: bool = False) -> None:
         """
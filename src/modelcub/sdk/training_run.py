@@ -5,14 +5,76 @@ Provides high-level Python API for training operations.
 """
 from __future__ import annotations
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List, Mapping, Union
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from dataclasses import dataclass
+from types import MappingProxyType
+import io
+import mmap
+import os
+import shutil
 import time
 
-
-@dataclass
+from ..core.compat import DATACLASS_SLOTS
+from ..core.io_utils import delete_tree
+from ..core.paths import resolve_path
+
+
+_TAIL_CHUNK = 64 * 1024
+# Logs at least this large are tailed through mmap instead of reads
+_MMAP_MIN = 1 << 20
+# get_logs(follow=True): sleep between reads at EOF, and how long the log
+# must stay idle before checking run status and rotation
+_FOLLOW_POLL = 0.2
+_FOLLOW_CHECK = 2.0
+
+
+def _split_lines(data: bytes) -> List[str]:
+    """Decode and split like a text-mode readlines() (universal newlines)."""
+    return io.StringIO(data.decode('utf-8', errors='replace'), newline=None).readlines()
+
+
+def _tail_lines(path: Path, lines: int, end: Optional[int] = None) -> List[str]:
+    """Last `lines` lines of a file (up to byte `end`), reading only its tail."""
+    with open(path, 'rb') as f:
+        if end is None:
+            end = f.seek(0, os.SEEK_END)
+
+        if end >= _MMAP_MIN:
+            # Large logs: scan the mapping for newlines so only the tail
+            # pages are faulted in, with no copy until the final slice
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    position = end
+                    for _ in range(lines + 1):
+                        position = mm.rfind(b'\n', 0, position)
+                        if position < 0:
+                            break
+                    return _split_lines(mm[position + 1:end])[-lines:]
+            except (OSError, ValueError):
+                pass  # e.g. filesystems that can't be mapped: read instead
+
+        chunks = deque()
+        newlines = 0
+        position = end
+        # One newline more than needed, so the partial line at the start
+        # of the first chunk read is never among those returned
+        while position > 0 and newlines <= lines:
+            size = min(_TAIL_CHUNK, position)
+            position -= size
+            f.seek(position)
+            chunk = f.read(size)
+            chunks.appendleft(chunk)
+            newlines += chunk.count(b'\n')
+
+    return _split_lines(b''.join(chunks))[-lines:]
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class RunMetrics:
-    """Training run metrics."""
+    """Training run metrics (immutable; TrainingRun.metrics hands out one shared instance per load)."""
     map50: Optional[float] = None
     map50_95: Optional[float] = None
     precision: Optional[float] = None
@@ -45,6 +107,10 @@ class TrainingRun:
         >>> print(f"mAP50: {run.metrics.map50}")
     """
 
+    __slots__ = (
+        "run_id", "_project_path", "_service", "_data", "_metrics_cache", "_artifacts_cache"
+    )
+
     def __init__(self, run_id: str, project_path: str | Path):
         """
         Initialize TrainingRun.
@@ -54,16 +120,44 @@ class TrainingRun:
             project_path: Project directory path
         """
         self.run_id = run_id
-        self._project_path = Path(project_path).resolve()
+        self._project_path = resolve_path(project_path)
+        self._service = None
         self._data = None
         self._load_data()
 
+    @classmethod
+    def _with_service(
+        cls, run_id: str, service, data: Optional[Dict[str, Any]] = None
+    ) -> TrainingRun:
+        """
+        Build a TrainingRun on an existing TrainingService (shared with its manager).
+
+        When data (the run's registry entry) is given it is used as is,
+        without reading the registry again.
+        """
+        run = cls.__new__(cls)
+        run.run_id = run_id
+        run._project_path = service.project_root
+        run._service = service
+        run._data = data
+        run._metrics_cache = None
+        run._artifacts_cache = None
+        if data is None:
+            run._load_data()
+        return run
+
+    def _get_service(self):
+        """TrainingService for this project, built once per run object."""
+        if self._service is None:
+            from ..services.training.training_service import TrainingService
+            self._service = TrainingService(self._project_path)
+        return self._service
+
     def _load_data(self) -> None:
         """Load run data from registry."""
-        from ..services.training.training_service import TrainingService
-
-        service = TrainingService(self._project_path)
-        self._data = service.get_status(self.run_id)
+        self._data = self._get_service().get_status(self.run_id)
+        self._metrics_cache = None
+        self._artifacts_cache = None
 
     # ========== Properties ==========
 
@@ -109,13 +203,17 @@ class TrainingRun:
 
     @property
     def metrics(self) -> RunMetrics:
-        """Training metrics (mAP, precision, recall, etc.)."""
-        return RunMetrics.from_dict(self._data.get('metrics', {}))
+        """Training metrics (mAP, precision, recall, etc.); built once per load."""
+        if self._metrics_cache is None:
+            self._metrics_cache = RunMetrics.from_dict(self._data.get('metrics') or {})
+        return self._metrics_cache
 
     @property
     def artifacts_path(self) -> Path:
-        """Path to run artifacts directory."""
-        return self._project_path / self._data['artifacts_path']
+        """Path to run artifacts directory; built once per load."""
+        if self._artifacts_cache is None:
+            self._artifacts_cache = self._project_path / self._data['artifacts_path']
+        return self._artifacts_cache
 
     @property
     def pid(self) -> Optional[int]:
@@ -144,9 +242,7 @@ class TrainingRun:
         Example:
             >>> run.start()
         """
-        from ..services.training.training_service import TrainingService
-
-        service = TrainingService(self._project_path)
+        service = self._get_service()
         service.start_run(self.run_id)
         self.reload()
 
@@ -164,9 +260,7 @@ class TrainingRun:
             >>> run.stop()
             >>> run.stop(timeout=30.0)
         """
-        from ..services.training.training_service import TrainingService
-
-        service = TrainingService(self._project_path)
+        service = self._get_service()
         service.stop_run(self.run_id, timeout=timeout)
         self.reload()
 
@@ -184,8 +278,15 @@ class TrainingRun:
         """
         Wait for training to complete.
 
+        With watchfiles installed (it comes with the ui extra), this wakes
+        as soon as the run registry changes instead of sleeping between
+        checks; poll_interval then only bounds how long a crashed training
+        process can go unnoticed. Otherwise the checks start poll_interval
+        apart and back off (up to 8x) while the status stays the same.
+
         Args:
-            poll_interval: Seconds between status checks
+            poll_interval: Seconds between status checks (initial interval
+                when polling)
             timeout: Maximum seconds to wait (None = no timeout)
 
         Returns:
@@ -195,13 +296,64 @@ class TrainingRun:
             >>> final_status = run.wait()
             >>> print(f"Training finished with status: {final_status}")
         """
-        start_time = time.time()
+        try:
+            from watchfiles import watch
+        except ImportError:
+            watch = None
+
+        if watch is not None:
+            return self._wait_for_changes(watch, poll_interval, timeout)
+
+        start_time = time.monotonic()
+        interval = poll_interval
+        last_status = self.status
 
         while self.status in ['pending', 'running']:
-            time.sleep(poll_interval)
+            delay = interval
+            if timeout:
+                # Don't let the backed-off interval overshoot the timeout
+                delay = max(0.0, min(delay, timeout - (time.monotonic() - start_time)))
+            time.sleep(delay)
+            self.reload()
+
+            if self.status != last_status:
+                last_status = self.status
+                interval = poll_interval
+            else:
+                interval = min(interval * 1.5, poll_interval * 8)
+
+            if timeout and (time.monotonic() - start_time) >= timeout:
+                raise TimeoutError(f"Training did not complete within {timeout}s")
+
+        return self.status
+
+    def _wait_for_changes(self, watch, poll_interval: float, timeout: Optional[float]) -> str:
+        """wait() driven by filesystem events on the run registry."""
+        start_time = time.monotonic()
+        registry_path = self._get_service().run_registry.registry_path
+        # Registry saves are atomic renames, so watch the directory rather
+        # than the file (whose inode is replaced on every write)
+        registry_name = registry_path.name
+
+        if self.status not in ['pending', 'running']:
+            return self.status
+
+        # Non-recursive: only runs.yaml matters, not trash/, cache/ or
+        # snapshots under .modelcub. A short debounce keeps the wakeup prompt
+        # (the 1600 ms default would add that much latency to every change).
+        for _ in watch(
+            registry_path.parent,
+            watch_filter=lambda change, path: os.path.basename(path) == registry_name,
+            recursive=False,
+            debounce=50,
+            rust_timeout=max(1, int(poll_interval * 1000)),
+            yield_on_timeout=True
+        ):
             self.reload()
+            if self.status not in ['pending', 'running']:
+                break
 
-            if timeout and (time.time() - start_time) > timeout:
+            if timeout and (time.monotonic() - start_time) > timeout:
                 raise TimeoutError(f"Training did not complete within {timeout}s")
 
         return self.status
@@ -211,7 +363,7 @@ class TrainingRun:
         stream: str = 'stdout',
         lines: Optional[int] = None,
         follow: bool = False
-    ) -> List[str]:
+    ) -> Union[List[str], Iterator[str]]:
         """
         Get training logs.
 
@@ -221,24 +373,81 @@ class TrainingRun:
             follow: If True, yield new lines as they appear
 
         Returns:
-            List of log lines
+            List of log lines, or with follow=True an iterator that yields
+            them and then new lines until the run finishes
 
         Example:
             >>> logs = run.get_logs(lines=50)
             >>> for line in logs:
             ...     print(line)
+            >>> for line in run.get_logs(lines=10, follow=True):
+            ...     print(line, end="")
         """
         log_file = self.artifacts_path / 'logs' / f'{stream}.log'
 
         if not log_file.exists():
             return []
 
+        if follow:
+            return self._follow_logs(log_file, lines)
+
+        if lines:
+            return _tail_lines(log_file, lines)
+
         with open(log_file, 'r') as f:
+            return f.readlines()
+
+    def _follow_logs(self, log_file: Path, lines: Optional[int]) -> Iterator[str]:
+        """Yield the log's last lines, then new ones until the run finishes."""
+        f = open(log_file, 'rb')
+        try:
             if lines:
-                all_lines = f.readlines()
-                return all_lines[-lines:]
-            else:
-                return f.readlines()
+                end = f.seek(0, os.SEEK_END)
+                yield from _tail_lines(log_file, lines, end=end)
+
+            partial = b''
+            idle = _FOLLOW_CHECK
+            finished = False
+            while True:
+                chunk = f.readline()
+                if chunk:
+                    idle = 0.0
+                    partial += chunk
+                    if partial.endswith(b'\n'):
+                        yield from _split_lines(partial)
+                        partial = b''
+                    continue
+
+                if finished:
+                    break
+
+                if idle >= _FOLLOW_CHECK:
+                    idle = 0.0
+                    if self._log_rotated(f, log_file):
+                        f.close()
+                        f = open(log_file, 'rb')
+                        continue
+                    self.reload()
+                    # Read once more after the final status, then stop
+                    finished = self.status not in ['pending', 'running']
+                    continue
+
+                time.sleep(_FOLLOW_POLL)
+                idle += _FOLLOW_POLL
+
+            if partial:
+                yield from _split_lines(partial)
+        finally:
+            f.close()
+
+    @staticmethod
+    def _log_rotated(f, log_file: Path) -> bool:
+        """Whether log_file now names a different file than the open one."""
+        try:
+            return os.stat(log_file).st_ino != os.fstat(f.fileno()).st_ino
+        except FileNotFoundError:
+            # Moved away and not recreated yet: keep reading the old one
+            return False
 
     def delete(self, keep_artifacts: bool = False) -> None:
         """
@@ -254,9 +463,6 @@ class TrainingRun:
             >>> run.delete()
             >>> run.delete(keep_artifacts=True)
         """
-        from ..services.training.training_service import TrainingService
-        import shutil
-
         if self.status == 'running':
             raise ValueError("Cannot delete running run. Stop it first.")
 
@@ -265,23 +471,31 @@ class TrainingRun:
             shutil.rmtree(self.artifacts_path)
 
         # Remove from registry
-        service = TrainingService(self._project_path)
-        service.run_registry.remove_run(self.run_id)
+        self._get_service().run_registry.remove_run(self.run_id)
 
     # ========== Utility Methods ==========
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, copy: bool = True) -> Union[Dict[str, Any], Mapping[str, Any]]:
         """
         Convert run to dictionary.
 
+        Args:
+            copy: Return an independent deep copy (default). With
+                copy=False, return a read-only view of the loaded run data
+                without copying; nested values (config, metrics) are
+                shared and must not be modified.
+
         Returns:
             Dictionary with all run information
 
         Example:
             >>> data = run.to_dict()
             >>> print(data['status'])
+            >>> status = run.to_dict(copy=False)['status']
         """
-        return self._data.copy()
+        if not copy:
+            return MappingProxyType(self._data)
+        return deepcopy(self._data)
 
     def __repr__(self) -> str:
         """String representation."""
@@ -307,7 +521,15 @@ class TrainingManager:
         Args:
             project_path: Project directory path
         """
-        self._project_path = Path(project_path).resolve()
+        self._project_path = resolve_path(project_path)
+        self._service = None
+
+    def _get_service(self):
+        """TrainingService for this project, built once and shared with the runs it returns."""
+        if self._service is None:
+            from ..services.training.training_service import TrainingService
+            self._service = TrainingService(self._project_path)
+        return self._service
 
     def create(
         self,
@@ -353,9 +575,7 @@ class TrainingManager:
             ...     device="cuda:0"
             ... )
         """
-        from ..services.training.training_service import TrainingService
-
-        service = TrainingService(self._project_path)
+        service = self._get_service()
 
         run_id = service.create_run(
             dataset_name=dataset_name,
@@ -372,7 +592,7 @@ class TrainingManager:
             **kwargs
         )
 
-        return TrainingRun(run_id, self._project_path)
+        return TrainingRun._with_service(run_id, service)
 
     def get(self, run_id: str) -> TrainingRun:
         """
@@ -390,7 +610,7 @@ class TrainingManager:
         Example:
             >>> run = training.get("run-20251027-143022")
         """
-        return TrainingRun(run_id, self._project_path)
+        return TrainingRun._with_service(run_id, self._get_service())
 
     def list(
         self,
@@ -410,12 +630,17 @@ class TrainingManager:
             >>> running = training.list(status='running')
             >>> completed = training.list(status='completed')
         """
-        from ..services.training.training_service import TrainingService
-
-        service = TrainingService(self._project_path)
+        service = self._get_service()
         runs_data = service.list_runs(status=status)
 
-        return [TrainingRun(r['id'], self._project_path) for r in runs_data]
+        # Seed each run with its listed entry; only running ones go through
+        # get_status, which also finalizes runs whose process has died
+        return [
+            TrainingRun._with_service(
+                r['id'], service, None if r.get('status') == 'running' else r
+            )
+            for r in runs_data
+        ]
 
     def purge(self, keep_artifacts: bool = False) -> int:
         """
@@ -444,13 +669,16 @@ class TrainingManager:
                 "Stop them first."
             )
 
-        # Delete all runs
-        deleted = 0
-        for run in runs:
-            run.delete(keep_artifacts=keep_artifacts)
-            deleted += 1
+        # Delete artifacts (rmtree is mostly metadata I/O, so run them in parallel)
+        if not keep_artifacts:
+            paths = [run.artifacts_path for run in runs]
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(delete_tree, paths))
+
+        # Remove from registry in one write
+        self._get_service().run_registry.remove_runs([run.run_id for run in runs])
 
-        return deleted
+        return len(runs)
 
     def __repr__(self) -> str:
         """String representation."""
@@ -8,8 +8,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, List, Dict, Any
-import json
+import os
 
+from ..core.compat import DATACLASS_SLOTS
+from ..core.io import dumps_json
 from ..core.service_result import ServiceResult
 from ..core.service_logging import log_service_call
 
@@ -18,7 +20,7 @@ from ..core.service_logging import log_service_call
 NULL_MARKER = "# NULL"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BoundingBox:
     """Bounding box in YOLO format (normalized 0-1)."""
     class_id: int
@@ -54,6 +56,14 @@ class SaveAnnotationRequest:
     is_null: bool = False  # Mark as null (intentionally empty)
 
 
+@dataclass
+class SaveAnnotationsBatchRequest:
+    """Request to save annotations for many images at once."""
+    dataset_name: str
+    items: Dict[str, List[BoundingBox]]  # image_id -> boxes
+    project_path: Path
+
+
 @dataclass
 class GetAnnotationRequest:
     """Request to get annotation(s)."""
@@ -98,6 +108,21 @@ def _find_image_split(project_path: Path, dataset_name: str, image_id: str) -> O
     return None
 
 
+def _index_image_splits(project_path: Path, dataset_name: str) -> Dict[str, str]:
+    """Map image_id -> split with one listing per split (first split wins, as in _find_image_split)."""
+    index: Dict[str, str] = {}
+    for split in ["train", "val", "test", "unlabeled"]:
+        try:
+            names = os.listdir(_get_images_dir(project_path, dataset_name, split))
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        for name in names:
+            stem, ext = os.path.splitext(name)
+            if ext in (".jpg", ".jpeg", ".png", ".bmp", ".webp"):
+                index.setdefault(stem, split)
+    return index
+
+
 def _get_label_path(project_path: Path, dataset_name: str, image_id: str) -> Optional[Path]:
     """Get label file path for an image."""
     split = _find_image_split(project_path, dataset_name, image_id)
@@ -196,6 +221,56 @@ def save_annotation(req: SaveAnnotationRequest) -> ServiceResult[Dict[str, Any]]
         )
 
 
+@log_service_call("save_annotations_batch")
+def save_annotations_batch(req: SaveAnnotationsBatchRequest) -> ServiceResult[Dict[str, Any]]:
+    """
+    Save annotations for many images in one call.
+
+    Image splits are resolved from one directory listing per split instead
+    of probing every extension in every split for each image.
+
+    Args:
+        req: Batch request mapping image_id to its boxes
+
+    Returns:
+        ServiceResult with {"success": [...], "failed": [...], "num_boxes": int}
+    """
+    try:
+        splits = _index_image_splits(req.project_path, req.dataset_name)
+        results = {"success": [], "failed": [], "num_boxes": 0}
+        labels_dirs: Dict[str, Path] = {}
+
+        for image_id, boxes in req.items.items():
+            split = splits.get(image_id)
+            if split is None:
+                results["failed"].append({"image_id": image_id, "error": f"Image not found: {image_id}"})
+                continue
+
+            labels_dir = labels_dirs.get(split)
+            if labels_dir is None:
+                labels_dir = _get_labels_dir(req.project_path, req.dataset_name, split)
+                labels_dir.mkdir(parents=True, exist_ok=True)
+                labels_dirs[split] = labels_dir
+
+            lines = [box.to_yolo_line() for box in boxes]
+            (labels_dir / f"{image_id}.txt").write_text(
+                "\n".join(lines) + "\n" if lines else "", encoding="utf-8"
+            )
+            results["success"].append(image_id)
+            results["num_boxes"] += len(lines)
+
+        return ServiceResult.ok(
+            data=results,
+            message=f"Saved annotations for {len(results['success'])}/{len(req.items)} images"
+        )
+
+    except Exception as e:
+        return ServiceResult.error(
+            f"Failed to save annotations: {str(e)}",
+            code=2
+        )
+
+
 @log_service_call("get_annotation")
 def get_annotation(req: GetAnnotationRequest) -> ServiceResult[Dict[str, Any]]:
     """
@@ -270,7 +345,7 @@ def get_annotation(req: GetAnnotationRequest) -> ServiceResult[Dict[str, Any]]:
 
             return ServiceResult.ok(
                 data=data,
-                message=json.dumps(data, indent=2)
+                message=dumps_json(data)
             )
 
         # All images
@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import shutil
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, Dict, Iterable, Optional, List, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import yaml
@@ -39,9 +39,9 @@ class ImportImagesResult:
 
 def _generate_dataset_id() -> str:
     """Generate unique dataset ID."""
-    import hashlib
-    import time
-    return hashlib.sha256(str(time.time()).encode()).hexdigest()[:8]
+    # Random rather than time-derived: back-to-back imports must not collide
+    import uuid
+    return uuid.uuid4().hex[:8]
 
 
 def _generate_dataset_name(source: Path) -> str:
@@ -61,20 +61,80 @@ def import_images(req: ImportImagesRequest) -> ImportImagesResult:
     Returns:
         Import result with success status and details
     """
+    result, entry = _stage_import(req)
+    if entry is not None:
+        DatasetRegistry(req.project_path).add_dataset(entry)
+    return result
+
+
+def import_images_batch(
+    reqs: List[ImportImagesRequest],
+    remove_names: Iterable[str] = ()
+) -> List[ImportImagesResult]:
+    """
+    Import several image directories, registering all datasets in one write.
+
+    Requests are processed in order; a failed request (including one that
+    raises) does not stop the others. Every request must target the same
+    project.
+
+    Args:
+        reqs: Import requests
+        remove_names: Datasets to drop from the registry in the same write
+            (e.g. ones cleared out to be replaced)
+
+    Returns:
+        One import result per request, in order
+    """
+    if not reqs:
+        return []
+
+    project_path = reqs[0].project_path
+    if any(req.project_path != project_path for req in reqs):
+        raise ValueError("All import requests must target the same project")
+
+    remove_names = list(remove_names)
+    results = []
+    entries = []
+    try:
+        for req in reqs:
+            try:
+                result, entry = _stage_import(req)
+            except Exception as e:
+                result, entry = ImportImagesResult(
+                    success=False,
+                    message=f"Import failed: {e}",
+                    dataset_name=req.dataset_name or ""
+                ), None
+
+            results.append(result)
+            if entry is not None:
+                entries.append(entry)
+    finally:
+        # Register whatever was staged, even if the loop was interrupted,
+        # so no copied dataset is left on disk without a registry entry
+        if entries or remove_names:
+            DatasetRegistry(project_path).add_datasets(entries, remove_names)
+
+    return results
+
+
+def _stage_import(req: ImportImagesRequest) -> Tuple[ImportImagesResult, Optional[Dict[str, Any]]]:
+    """Copy images and write dataset files; return the result and its registry entry."""
     # Validate source
     if not req.source.exists():
         return ImportImagesResult(
             success=False,
             message=f"Source directory not found: {req.source}",
             dataset_name=""
-        )
+        ), None
 
     if not req.source.is_dir():
         return ImportImagesResult(
             success=False,
             message=f"Source must be a directory: {req.source}",
             dataset_name=""
-        )
+        ), None
 
     # Scan for images
     scan_result = scan_directory(req.source, recursive=req.recursive)
@@ -84,7 +144,7 @@ def import_images(req: ImportImagesRequest) -> ImportImagesResult:
             success=False,
             message="No valid images found in source directory",
             dataset_name=""
-        )
+        ), None
 
     # Generate dataset name if not provided
     dataset_name = req.dataset_name or _generate_dataset_name(req.source)
@@ -102,7 +162,7 @@ def import_images(req: ImportImagesRequest) -> ImportImagesResult:
             success=False,
             message=f"Dataset already exists: {dataset_name}. Use --force to overwrite.",
             dataset_name=dataset_name
-        )
+        ), None
 
     # Create directory structure
     images_dir.mkdir(parents=True, exist_ok=True)
@@ -194,9 +254,8 @@ def import_images(req: ImportImagesRequest) -> ImportImagesResult:
     with open(import_info_path, 'w') as f:
         json.dump(import_info, f, indent=2)
 
-    # Register dataset
-    registry = DatasetRegistry(req.project_path)
-    registry.add_dataset({
+    # Registry entry (written by the caller)
+    entry = {
         "id": dataset_id,
         "name": dataset_name,
         "created": manifest["created"],
@@ -210,9 +269,7 @@ def import_images(req: ImportImagesRequest) -> ImportImagesResult:
         "path": f"data/datasets/{dataset_name}",
         "source": str(req.source),
         "num_classes": len(classes)
-    })
-
-    registry.save()
+    }
 
     # Format message
     size_str = format_size(total_size)
@@ -230,4 +287,4 @@ def import_images(req: ImportImagesRequest) -> ImportImagesResult:
         dataset_name=dataset_name,
         dataset_path=dataset_dir,
         images_imported=imported_count
-    )
\ No newline at end of file
+    ), entry
\ No newline at end of file
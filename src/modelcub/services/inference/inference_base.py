@@ -153,4 +153,16 @@ class InferenceAdapter(ABC):
     @abstractmethod
     def is_loaded(self) -> bool:
         """Check if model is loaded."""
+        pass
+
+    def warmup(self, imgsz: int = 640, runs: int = 2) -> None:
+        """
+        Run dummy inferences so the first real prediction runs at steady-state speed.
+
+        Adapters without a cold-start cost can keep this default no-op.
+
+        Args:
+            imgsz: Side length of the square dummy image
+            runs: Number of dummy forward passes
+        """
         pass
\ No newline at end of file
@@ -5,15 +5,77 @@ Handles inference job creation, execution, and result management.
 """
 
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, TYPE_CHECKING
 from datetime import datetime
 import json
+import os
 import yaml
 import logging
 
+if TYPE_CHECKING:
+    from .inference_base import InferenceAdapter, ImagePrediction
+
 logger = logging.getLogger(__name__)
 
 
+_IMAGE_SUFFIXES = {'.jpg', '.jpeg', '.png', '.bmp', '.webp'}
+
+
+def _list_images(directory: Path, any_case: bool = True) -> List[Path]:
+    """Image files directly inside directory, from a single directory scan."""
+    images = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                suffix = os.path.splitext(entry.name)[1]
+                if any_case:
+                    suffix = suffix.lower()
+                if suffix in _IMAGE_SUFFIXES and entry.is_file():
+                    images.append(Path(entry.path))
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return images
+
+
+def collect_images(input_type: str, path: Path) -> List[Path]:
+    """Collect image paths for an input type ('image', 'images' or 'dataset')."""
+    images = []
+
+    if input_type == 'image':
+        # Single image
+        if path.exists():
+            images.append(path)
+
+    elif input_type == 'images':
+        # Directory of images
+        images.extend(_list_images(path))
+
+    elif input_type == 'dataset':
+        # Dataset directory (look for images in splits)
+        for split in ['train', 'valid', 'test', 'val']:
+            images.extend(_list_images(path / split / 'images', any_case=False))
+
+    return sorted(images)
+
+
+def summarize_predictions(predictions: List["ImagePrediction"]) -> Dict[str, Any]:
+    """Aggregate per-image predictions into inference job stats."""
+    total_detections = sum(len(p.detections) for p in predictions)
+    avg_inference_time = (
+        sum(p.inference_time_ms for p in predictions) / len(predictions)
+        if predictions else 0.0
+    )
+
+    return {
+        'total_images': len(predictions),
+        'total_detections': total_detections,
+        'avg_inference_time_ms': round(avg_inference_time, 2),
+        'classes_detected': list(set(
+            d.class_name for p in predictions for d in p.detections
+        ))
+    }
+
+
 class InferenceService:
     """
     Service for managing inference operations.
@@ -161,7 +223,8 @@ class InferenceService:
     def run_inference(
     self,
     inference_id: str,
-    progress_callback: Optional[callable] = None
+    progress_callback: Optional[callable] = None,
+    adapter: Optional["InferenceAdapter"] = None
 ) -> Dict[str, Any]:
         """
         Execute inference job.
@@ -169,6 +232,8 @@ class InferenceService:
         Args:
             inference_id: Inference job ID
             progress_callback: Optional callback(current, total, message)
+            adapter: Adapter with the job's model already loaded; skips
+                loading the weights again when given
 
         Returns:
             Results dictionary with stats
@@ -186,15 +251,16 @@ class InferenceService:
         try:
             # Load model
             model_path = self.project_root / job['model_path']
-            adapter = YOLOInferenceAdapter()
+            if adapter is None:
+                adapter = YOLOInferenceAdapter()
 
-            if progress_callback:
-                progress_callback(0, 100, f"Loading model: {model_path.name}")
+                if progress_callback:
+                    progress_callback(0, 100, f"Loading model: {model_path.name}")
 
-            adapter.load_model(
-                model_path,
-                device=job['config']['device']
-            )
+                adapter.load_model(
+                    model_path,
+                    device=job['config']['device']
+                )
 
             # Collect images
             images = self._collect_images(job['input_type'], job['input_path'])
@@ -223,17 +289,7 @@ class InferenceService:
             self._save_results(predictions, output_path, config, adapter)  # ← CHANGED
 
             # Calculate stats
-            total_detections = sum(len(p.detections) for p in predictions)
-            avg_inference_time = sum(p.inference_time_ms for p in predictions) / len(predictions)
-
-            stats = {
-                'total_images': len(images),
-                'total_detections': total_detections,
-                'avg_inference_time_ms': round(avg_inference_time, 2),
-                'classes_detected': list(set(
-                    d.class_name for p in predictions for d in p.detections
-                ))
-            }
+            stats = summarize_predictions(predictions)
 
             # Update job
             self.inference_registry.update_inference(inference_id, {
@@ -258,33 +314,12 @@ class InferenceService:
 
     def _collect_images(self, input_type: str, input_path: str) -> List[Path]:
         """Collect image paths based on input type."""
-        images = []
         path = Path(input_path)
 
         if not path.is_absolute():
             path = self.project_root / path
 
-        if input_type == 'image':
-            # Single image
-            if path.exists():
-                images.append(path)
-
-        elif input_type == 'images':
-            # Directory of images
-            if path.is_dir():
-                for ext in ['*.jpg', '*.jpeg', '*.png', '*.bmp', '*.webp']:
-                    images.extend(path.glob(ext))
-                    images.extend(path.glob(ext.upper()))
-
-        elif input_type == 'dataset':
-            # Dataset directory (look for images in splits)
-            for split in ['train', 'valid', 'test', 'val']:
-                split_dir = path / split / 'images'
-                if split_dir.exists():
-                    for ext in ['*.jpg', '*.jpeg', '*.png', '*.bmp', '*.webp']:
-                        images.extend(split_dir.glob(ext))
-
-        return sorted(images)
+        return collect_images(input_type, path)
 
     def _save_results(
         self,
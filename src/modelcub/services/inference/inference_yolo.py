@@ -4,8 +4,12 @@ YOLO inference adapter for Ultralytics integration.
 Handles YOLO-specific inference using the Ultralytics library.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional
+import copy
+import os
+import threading
 import time
 from .inference_base import (
     InferenceAdapter,
@@ -14,6 +18,49 @@ from .inference_base import (
     BoundingBox
 )
 
+# ultralytics (and torch with it) is imported on first model load, not at
+# SDK import; the class is kept here once resolved.
+_YOLO = None
+_DEFAULT_DEVICE: Optional[str] = None
+
+
+def _yolo_cls():
+    """Return ultralytics.YOLO, importing it on first use."""
+    global _YOLO
+    if _YOLO is None:
+        try:
+            from ultralytics import YOLO
+        except ImportError:
+            raise ImportError(
+                "Ultralytics not installed. Install with: pip install ultralytics"
+            )
+        _YOLO = YOLO
+    return _YOLO
+
+
+def default_device() -> str:
+    """Pick "cuda:0" when a CUDA device is usable, otherwise "cpu"."""
+    global _DEFAULT_DEVICE
+    if _DEFAULT_DEVICE is None:
+        try:
+            import torch
+            _DEFAULT_DEVICE = "cuda:0" if torch.cuda.is_available() else "cpu"
+        except ImportError:
+            _DEFAULT_DEVICE = "cpu"
+    return _DEFAULT_DEVICE
+
+
+def _read_image(path: Path):
+    """Decode an image to a BGR array (cv2 ships with ultralytics)."""
+    import cv2
+    import numpy as np
+
+    # imdecode over fromfile, like Ultralytics, so non-ASCII paths work
+    image = cv2.imdecode(np.fromfile(str(path), dtype=np.uint8), cv2.IMREAD_COLOR)
+    if image is None:
+        raise ValueError(f"Could not decode image: {path}")
+    return image
+
 
 class YOLOInferenceAdapter(InferenceAdapter):
     """
@@ -25,15 +72,13 @@ class YOLOInferenceAdapter(InferenceAdapter):
     def __init__(self):
         self.model = None
         self._class_names = []
+        self._half = False
+        self._fused = False
+        self._share_lock = threading.Lock()
 
     def load_model(self, model_path: Path, device: str = "cpu") -> None:
         """Load YOLO model from file."""
-        try:
-            from ultralytics import YOLO
-        except ImportError:
-            raise ImportError(
-                "Ultralytics not installed. Install with: pip install ultralytics"
-            )
+        YOLO = _yolo_cls()
 
         if not model_path.exists():
             raise FileNotFoundError(f"Model not found: {model_path}")
@@ -41,8 +86,9 @@ class YOLOInferenceAdapter(InferenceAdapter):
         # Load model
         self.model = YOLO(str(model_path))
 
-        # Set device
+        # Set device; on CUDA, predict in FP16 (Ultralytics casts per call)
         self.model.to(device)
+        self._half = str(device).startswith("cuda")
 
         # Extract class names
         if hasattr(self.model, 'names'):
@@ -50,6 +96,32 @@ class YOLOInferenceAdapter(InferenceAdapter):
         else:
             self._class_names = []
 
+    def share(self) -> "YOLOInferenceAdapter":
+        """
+        New adapter on the same loaded network, with its own predictor.
+
+        Ultralytics predictors keep per-call state, so threads can't share
+        one; the network's weights are shared rather than loaded again.
+        """
+        if not self.is_loaded:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+
+        with self._share_lock:
+            # Predictor setup fuses the network in place; do it once here
+            # rather than racing in several adapters' first predicts
+            if not self._fused:
+                self.model.fuse()
+                self._fused = True
+
+        adapter = YOLOInferenceAdapter()
+        # Shallow copy: the wrapped nn.Module is shared, the predictor is not
+        adapter.model = copy.copy(self.model)
+        adapter.model.predictor = None
+        adapter._class_names = self._class_names
+        adapter._half = self._half
+        adapter._fused = True
+        return adapter
+
     def predict_image(
         self,
         image_path: Path,
@@ -71,6 +143,7 @@ class YOLOInferenceAdapter(InferenceAdapter):
             conf=conf_threshold,
             iou=iou_threshold,
             classes=classes,
+            half=self._half,
             verbose=False
         )
         inference_time_ms = (time.time() - start_time) * 1000
@@ -135,63 +208,94 @@ class YOLOInferenceAdapter(InferenceAdapter):
                 raise FileNotFoundError(f"Image not found: {img_path}")
 
         predictions = []
+        batches = [image_paths[i:i + batch_size] for i in range(0, len(image_paths), batch_size)]
+        if not batches:
+            return predictions
+
+        # Decode the next batch on worker threads while the current one is
+        # in the forward pass; cv2 releases the GIL so the decodes overlap.
+        with ThreadPoolExecutor(max_workers=min(batch_size, os.cpu_count() or 1)) as pool:
+            pending = [pool.submit(_read_image, p) for p in batches[0]]
+
+            for index, batch_paths in enumerate(batches):
+                frames = [future.result() for future in pending]
+                if index + 1 < len(batches):
+                    pending = [pool.submit(_read_image, p) for p in batches[index + 1]]
+
+                # Run inference on batch
+                start_time = time.time()
+                # batch= makes Ultralytics run the list as one forward pass
+                # (it defaults to one image at a time for list sources)
+                results = self.model.predict(
+                    source=frames,
+                    conf=conf_threshold,
+                    iou=iou_threshold,
+                    classes=classes,
+                    batch=len(batch_paths),
+                    half=self._half,
+                    verbose=False
+                )
+                batch_time = (time.time() - start_time) * 1000
+                avg_time_per_image = batch_time / len(batch_paths)
 
-        # Process in batches
-        for i in range(0, len(image_paths), batch_size):
-            batch_paths = image_paths[i:i + batch_size]
-
-            # Run inference on batch
-            start_time = time.time()
-            results = self.model.predict(
-                source=[str(p) for p in batch_paths],
-                conf=conf_threshold,
-                iou=iou_threshold,
-                classes=classes,
-                verbose=False
-            )
-            batch_time = (time.time() - start_time) * 1000
-            avg_time_per_image = batch_time / len(batch_paths)
-
-            # Parse each result
-            for result, img_path in zip(results, batch_paths):
-                img_height, img_width = result.orig_shape
-
-                detections = []
-                if result.boxes is not None and len(result.boxes) > 0:
-                    boxes = result.boxes.cpu()
-
-                    for box in boxes:
-                        xywhn = box.xywhn[0].tolist()
-                        x_center, y_center, width, height = xywhn
-
-                        class_id = int(box.cls[0].item())
-                        confidence = float(box.conf[0].item())
-                        class_name = self._class_names[class_id] if class_id < len(self._class_names) else str(class_id)
-
-                        detection = Detection(
-                            class_id=class_id,
-                            class_name=class_name,
-                            confidence=confidence,
-                            bbox=BoundingBox(
-                                x=x_center,
-                                y=y_center,
-                                width=width,
-                                height=height
-                            )
+                predictions.extend(self._parse_batch(results, batch_paths, avg_time_per_image))
+
+        return predictions
+
+    def _parse_batch(self, results, batch_paths: List[Path], avg_time_per_image: float) -> List[ImagePrediction]:
+        """Convert one batch of Ultralytics results into predictions."""
+        predictions = []
+        # Parse each result
+        for result, img_path in zip(results, batch_paths):
+            img_height, img_width = result.orig_shape
+
+            detections = []
+            if result.boxes is not None and len(result.boxes) > 0:
+                boxes = result.boxes.cpu()
+
+                for box in boxes:
+                    xywhn = box.xywhn[0].tolist()
+                    x_center, y_center, width, height = xywhn
+
+                    class_id = int(box.cls[0].item())
+                    confidence = float(box.conf[0].item())
+                    class_name = self._class_names[class_id] if class_id < len(self._class_names) else str(class_id)
+
+                    detection = Detection(
+                        class_id=class_id,
+                        class_name=class_name,
+                        confidence=confidence,
+                        bbox=BoundingBox(
+                            x=x_center,
+                            y=y_center,
+                            width=width,
+                            height=height
                         )
-                        detections.append(detection)
-
-                prediction = ImagePrediction(
-                    image_path=str(img_path),
-                    image_width=img_width,
-                    image_height=img_height,
-                    detections=detections,
-                    inference_time_ms=avg_time_per_image
-                )
-                predictions.append(prediction)
+                    )
+                    detections.append(detection)
+
+            prediction = ImagePrediction(
+                image_path=str(img_path),
+                image_width=img_width,
+                image_height=img_height,
+                detections=detections,
+                inference_time_ms=avg_time_per_image
+            )
+            predictions.append(prediction)
 
         return predictions
 
+    def warmup(self, imgsz: int = 640, runs: int = 2) -> None:
+        """Run dummy forward passes to absorb cuDNN autotune and allocator cold start."""
+        if not self.is_loaded:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+
+        import numpy as np
+
+        dummy = np.zeros((imgsz, imgsz, 3), dtype=np.uint8)
+        for _ in range(runs):
+            self.model.predict(source=dummy, imgsz=imgsz, half=self._half, verbose=False)
+
     def get_class_names(self) -> List[str]:
         """Get list of class names."""
         if not self.is_loaded:
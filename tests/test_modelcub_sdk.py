@@ -13,9 +13,11 @@ from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch, PropertyMock
 from datetime import datetime
 from typing import List, Dict, Any
+import os
 import tempfile
 import shutil
 import json
+import dataclasses
 
 # Import SDK components
 from modelcub.sdk import (
@@ -26,7 +28,9 @@ from modelcub.sdk import (
     JobManager,
     Job,
     JobStatus,
-    TaskStatus
+    TaskStatus,
+    TrainingManager,
+    ModelManager
 )
 
 
@@ -117,6 +121,11 @@ class TestProject:
 
             # Use .resolve() to handle symlinks and /private/ prefix on macOS
             assert project.path.resolve() == mock_project_path.resolve()
+
+            # Config is parsed lazily, on first access
+            mock_load.assert_not_called()
+            project.config
+            project.config
             mock_load.assert_called_once()
 
     def test_project_init_with_invalid_path(self, temp_dir):
@@ -224,6 +233,7 @@ class TestProject:
         with patch('modelcub.sdk.project.load_config', return_value=mock_config):
             project = Project(mock_project_path)
 
+            assert project.config == mock_config
             assert project._config == mock_config
 
     def test_project_str_representation(self, mock_project_path):
@@ -239,6 +249,307 @@ class TestProject:
             assert hasattr(project, 'path')
             assert hasattr(project, '_config')
 
+    def test_project_exists_memoizes_marker_check(self, temp_dir):
+        """Test back-to-back existence checks share one stat until invalidated."""
+        project_path = temp_dir / "fresh"
+        assert Project.exists(project_path) is False
+
+        (project_path / ".modelcub").mkdir(parents=True)
+        (project_path / ".modelcub" / "config.yaml").write_text("project: {}")
+        assert Project.exists(project_path) is False  # still within the TTL
+
+        Project.invalidate_exists_cache(project_path)
+        assert Project.exists(project_path) is True
+
+    def test_project_registries_are_cached(self, mock_project_path):
+        """Test Project reuses its registry objects until reload_registries()."""
+        with patch('modelcub.sdk.project.load_config', return_value=MagicMock()):
+            project = Project(mock_project_path)
+
+        datasets, runs = project.datasets, project.runs
+        assert project.datasets is datasets
+        assert project.runs is runs
+
+        project.reload_registries()
+        assert project.datasets is not datasets
+        assert project.runs is not runs
+
+    def test_project_list_datasets_reads_registry_once(self, mock_project_path):
+        """Test list_datasets hydrates datasets from the listing without per-item lookups."""
+        with patch('modelcub.sdk.project.load_config', return_value=MagicMock()):
+            project = Project(mock_project_path)
+
+        registry = MagicMock()
+        registry.list_datasets.return_value = [
+            {"name": "ds-a", "num_images": 3},
+            {"status": "broken"},
+            {"name": "ds-b", "status": "unlabeled"},
+        ]
+        project._dataset_registry = registry
+
+        datasets = project.list_datasets()
+
+        assert [d.name for d in datasets] == ["ds-a", "ds-b"]
+        assert datasets[0].images == 3
+        assert datasets[1].path == project.path / "data" / "datasets" / "ds-b"
+        registry.list_datasets.assert_called_once()
+        registry.get_dataset.assert_not_called()
+
+    def test_project_path_properties_cached_until_config_changes(self, mock_project_path):
+        """Test path properties are computed once and refreshed on config edits."""
+        project = Project(mock_project_path)
+
+        data_dir = project.data_dir
+        assert project.data_dir is data_dir
+        assert project.datasets_dir == data_dir / "datasets"
+
+        project.set_config("paths.data", "storage")
+        assert project.data_dir == project.path / "storage"
+        assert project.datasets_dir == project.path / "storage" / "datasets"
+
+        project.reload_config()
+        assert project.data_dir == project.path / "data"
+        assert not hasattr(project, "__dict__")
+
+    def test_project_load_resolves_path_once(self, mock_project_path):
+        """Test Project.load resolves its path once and hands it to the instance."""
+        from modelcub.core.paths import resolve_path
+
+        with patch('modelcub.sdk.project.resolve_path', wraps=resolve_path) as mock_resolve:
+            project = Project.load(str(mock_project_path))
+
+        mock_resolve.assert_called_once()
+        assert project.path == mock_project_path.resolve()
+
+    def test_project_get_and_set_config_by_path(self, mock_project_path):
+        """Test dot-path config access, including invalid paths."""
+        project = Project(mock_project_path)
+
+        project.set_config("defaults.batch_size", 64)
+        assert project.get_config("defaults.batch_size") == 64
+        assert project.get_config("defaults.missing", "fallback") == "fallback"
+        assert project.get_config("nope.batch_size") is None
+
+        for bad in ("defaults", "nope.batch_size", "defaults.missing", "defaults..batch_size"):
+            with pytest.raises(ValueError, match="Invalid config path"):
+                project.set_config(bad, 1)
+
+    def test_parse_classes_accepts_strings_and_iterables(self):
+        """Test import_dataset class normalization."""
+        from modelcub.sdk.project import _parse_classes
+
+        assert _parse_classes(" cat, dog,,bird ,") == ["cat", "dog", "bird"]
+        assert _parse_classes(("cat", "dog")) == ["cat", "dog"]
+        classes = ["cat"]
+        assert _parse_classes(classes) is classes
+        assert _parse_classes(None) is None
+
+    def test_import_dataset_delete_existent_moves_old_tree_aside(self, mock_project_path):
+        """Test delete_existent clears the old dataset path before importing and reaps it."""
+        project = Project(mock_project_path)
+        old = project.datasets_dir / "animals"
+        (old / "train" / "images").mkdir(parents=True)
+
+        seen = {}
+
+        def fake_import(req):
+            seen["exists"] = old.exists()
+            return MagicMock(success=False, message="boom")
+
+        with patch('modelcub.services.image_service.import_images', side_effect=fake_import):
+            with pytest.raises(ValueError, match="boom"):
+                project.import_dataset(mock_project_path, name="animals", delete_existent=True)
+
+        assert seen["exists"] is False
+
+        # The staged tree goes through the exit-joined reaper, not an untracked thread
+        from modelcub.core.io_utils import _join_pending_deletes
+        _join_pending_deletes()
+        assert not (project.modelcub_dir / "trash").exists()
+
+    def test_project_context_manager_saves_only_dirty_config(self, mock_project_path):
+        """Test __exit__ writes config only after a change and a clean exit."""
+        with patch('modelcub.sdk.project.save_config') as mock_save:
+            with Project(mock_project_path) as project:
+                project.get_config("defaults.batch_size")
+            mock_save.assert_not_called()
+
+            with pytest.raises(RuntimeError):
+                with Project(mock_project_path) as project:
+                    project.set_config("defaults.batch_size", 64)
+                    raise RuntimeError("abort")
+            mock_save.assert_not_called()
+
+            with Project(mock_project_path) as project:
+                project.set_config("defaults.batch_size", 64)
+            mock_save.assert_called_once()
+
+    def test_project_get_datasets_uses_one_registry(self, mock_project_path):
+        """Test get_dataset/get_datasets hydrate from the project's registry."""
+        project = Project(mock_project_path)
+        registry = MagicMock()
+        registry.get_dataset.return_value = {"name": "ds-a", "num_images": 3}
+        registry.get_datasets.return_value = [{"name": "ds-b"}, {"name": "ds-a"}]
+        project._dataset_registry = registry
+
+        with patch('modelcub.sdk.dataset.DatasetRegistry') as mock_cls:
+            dataset = project.get_dataset("ds-a")
+            datasets = project.get_datasets(["ds-b", "ds-a"])
+
+        assert dataset.images == 3
+        assert [d.name for d in datasets] == ["ds-b", "ds-a"]
+        registry.get_datasets.assert_called_once_with(["ds-b", "ds-a"])
+        mock_cls.assert_not_called()
+
+    def test_project_repr_does_not_load_config(self, mock_project_path):
+        """Test repr/str fall back to the directory name until config is loaded."""
+        project = Project(mock_project_path)
+
+        with patch('modelcub.sdk.project.load_config') as mock_load:
+            assert repr(project) == f"Project(name='{mock_project_path.name}', path='{project.path}')"
+            assert str(project) == f"ModelCub Project: {mock_project_path.name}"
+            mock_load.assert_not_called()
+
+        assert str(project) == f"ModelCub Project: {project.name}"
+
+    def test_import_datasets_registers_batch_in_one_write(self, mock_project_path, temp_dir):
+        """Test import_datasets writes the registry once and reports failures per item."""
+        from modelcub.core.images import ImageInfo, ScanResult
+        from modelcub.core.registries import DatasetRegistry
+
+        def fake_scan(source, recursive=False):
+            images = sorted(source.glob("*.jpg"))
+            infos = [ImageInfo(p, p.stat().st_size, 1, 1, "JPEG") for p in images]
+            return ScanResult(valid=infos, invalid=[], total_size_bytes=0)
+
+        for folder in ("cats", "dogs"):
+            (temp_dir / folder).mkdir()
+            (temp_dir / folder / "a.jpg").write_bytes(b"x")
+
+        project = Project(mock_project_path)
+        with patch('modelcub.services.image_service.scan_directory', side_effect=fake_scan), \
+                patch.object(DatasetRegistry, '_save_registry', autospec=True,
+                             side_effect=DatasetRegistry._save_registry) as mock_save:
+            result = project.import_datasets([
+                {"source": temp_dir / "cats", "name": "cats", "classes": "cat"},
+                {"source": temp_dir / "missing", "name": "missing"},
+                {"source": temp_dir / "dogs", "name": "dogs", "classes": ["dog"]},
+            ])
+
+        assert mock_save.call_count == 1
+        assert [d.name for d in result["success"]] == ["cats", "dogs"]
+        assert result["success"][0].list_classes() == ["cat"]
+        assert [f["name"] for f in result["failed"]] == ["missing"]
+        assert "not found" in result["failed"][0]["error"]
+        assert {d.name for d in project.list_datasets()} == {"cats", "dogs"}
+
+    def test_import_datasets_registers_staged_items_when_one_raises(self, mock_project_path, temp_dir):
+        """Test an exception while staging one spec fails that item only; the others are registered."""
+        from modelcub.core.images import ImageInfo, ScanResult
+        from modelcub.services import image_service
+
+        def fake_scan(source, recursive=False):
+            images = sorted(source.glob("*.jpg"))
+            infos = [ImageInfo(p, p.stat().st_size, 1, 1, "JPEG") for p in images]
+            return ScanResult(valid=infos, invalid=[], total_size_bytes=0)
+
+        real_stage = image_service._stage_import
+
+        def flaky_stage(req):
+            if req.dataset_name == "b":
+                raise PermissionError("denied")
+            return real_stage(req)
+
+        for folder in ("a", "b", "c"):
+            (temp_dir / folder).mkdir()
+            (temp_dir / folder / "x.jpg").write_bytes(b"x")
+
+        project = Project(mock_project_path)
+        with patch('modelcub.services.image_service.scan_directory', side_effect=fake_scan), \
+                patch('modelcub.services.image_service._stage_import', side_effect=flaky_stage):
+            result = project.import_datasets([
+                {"source": temp_dir / folder, "name": folder} for folder in ("a", "b", "c")
+            ])
+
+        assert [d.name for d in result["success"]] == ["a", "c"]
+        assert [f["name"] for f in result["failed"]] == ["b"]
+        assert "denied" in result["failed"][0]["error"]
+        assert {d.name for d in project.list_datasets()} == {"a", "c"}
+
+    def test_import_datasets_validates_specs_before_clearing(self, mock_project_path, temp_dir):
+        """Test a bad spec fails before delete_existent clears anything, and clearing shares the one write."""
+        from modelcub.core.images import ImageInfo, ScanResult
+        from modelcub.core.registries import DatasetRegistry
+
+        def fake_scan(source, recursive=False):
+            images = sorted(source.glob("*.jpg"))
+            infos = [ImageInfo(p, p.stat().st_size, 1, 1, "JPEG") for p in images]
+            return ScanResult(valid=infos, invalid=[], total_size_bytes=0)
+
+        (temp_dir / "cats").mkdir()
+        (temp_dir / "cats" / "a.jpg").write_bytes(b"x")
+
+        project = Project(mock_project_path)
+        old = project.datasets_dir / "cats"
+        (old / "train" / "images").mkdir(parents=True)
+        project.datasets.add_dataset({"id": "old", "name": "cats", "path": "data/datasets/cats"})
+
+        specs = [{"source": temp_dir / "cats", "name": "cats", "delete_existent": True}]
+        with pytest.raises(TypeError):
+            project.import_datasets(specs + [{"source": temp_dir / "cats", "nmae": "typo"}])
+        assert old.exists()
+        assert project.datasets.get_dataset("cats")["id"] == "old"
+
+        with patch('modelcub.services.image_service.scan_directory', side_effect=fake_scan), \
+                patch.object(DatasetRegistry, '_save_registry', autospec=True,
+                             side_effect=DatasetRegistry._save_registry) as mock_save:
+            result = project.import_datasets(specs)
+
+        assert mock_save.call_count == 1
+        assert [d.name for d in result["success"]] == ["cats"]
+        assert [d["name"] for d in project.datasets.list_datasets()] == ["cats"]
+        assert project.datasets.get_dataset("cats")["id"] != "old"
+        assert not (old / "train").exists()
+
+    def test_project_root_is_cached_per_cwd(self, mock_project_path, monkeypatch):
+        """Test project_root() reuses a found root and drops it once the project is gone."""
+        from modelcub.core.paths import project_root, clear_project_root_cache
+
+        subdir = mock_project_path / "data" / "datasets"
+        monkeypatch.chdir(subdir)
+        clear_project_root_cache()
+
+        assert project_root() == mock_project_path.resolve()
+        with patch.object(Path, 'parents', new_callable=PropertyMock) as mock_parents:
+            assert project_root() == mock_project_path.resolve()
+            mock_parents.assert_not_called()
+
+        shutil.rmtree(mock_project_path / ".modelcub")
+        assert project_root() == subdir.resolve()
+
+    def test_project_init_refreshes_cached_root(self, mock_project_path, monkeypatch):
+        """Test Project.load() sees a project created below a cached root."""
+        nested = mock_project_path / "experiments" / "nested"
+        nested.mkdir(parents=True)
+        monkeypatch.chdir(nested)
+
+        with patch('modelcub.sdk.project.load_config', return_value=MagicMock()):
+            assert Project.load().path == mock_project_path.resolve()
+
+        Project.init("nested", path=nested)
+        assert Project.load().path == nested.resolve()
+
+    def test_resolve_path_keys_relative_paths_on_cwd(self, mock_project_path, monkeypatch):
+        """Test resolve_path() memoizes per input without leaking across directories."""
+        from modelcub.core.paths import resolve_path
+
+        monkeypatch.chdir(mock_project_path)
+        assert resolve_path("data") == (mock_project_path / "data").resolve()
+        assert resolve_path(mock_project_path) == mock_project_path.resolve()
+
+        monkeypatch.chdir(mock_project_path / "data")
+        assert resolve_path("data") == (mock_project_path / "data" / "data").resolve()
+
 
 # ============================================================================
 # DATASET TESTS
@@ -328,6 +639,18 @@ class TestDataset:
 
         assert dataset.status == "ready"
 
+    def test_dataset_repr_and_str(self, mock_project_path, mock_dataset_registry):
+        """Test Dataset string representations."""
+        mock_dataset_registry.get_dataset.return_value = {
+            "name": "test_dataset",
+            "num_images": 42
+        }
+
+        dataset = Dataset("test_dataset", project_path=mock_project_path)
+
+        assert repr(dataset) == "Dataset(name='test_dataset', images=42, status='ready')"
+        assert str(dataset) == "Dataset: test_dataset (42 images)"
+
     def test_dataset_load_class_method(self, mock_project_path, mock_dataset_registry):
         """Test Dataset.load() class method."""
         mock_dataset_registry.get_dataset.return_value = {"name": "test_dataset"}
@@ -337,6 +660,80 @@ class TestDataset:
         assert isinstance(dataset, Dataset)
         assert dataset.name == "test_dataset"
 
+    def test_dataset_reuses_registry_across_calls(self, mock_project_path):
+        """Test Dataset builds one DatasetRegistry and reuses it for class operations."""
+        with patch('modelcub.sdk.dataset.DatasetRegistry') as mock_cls:
+            registry = mock_cls.return_value
+            registry.get_dataset.return_value = {"name": "test_dataset"}
+            registry.add_class.return_value = 0
+
+            dataset = Dataset("test_dataset", project_path=mock_project_path)
+            dataset.add_class("cat")
+            dataset.rename_class("cat", "feline")
+            dataset.list_classes()
+
+            mock_cls.assert_called_once()
+
+    def test_dataset_class_mutations_update_cached_metadata(self, mock_project_path):
+        """Test class mutations keep Dataset metadata in sync without a registry re-read."""
+        from modelcub.core.registries import DatasetRegistry
+
+        (mock_project_path / "data" / "datasets" / "test_dataset").mkdir(parents=True)
+        DatasetRegistry(mock_project_path).add_dataset(
+            {"id": "ds_1", "name": "test_dataset", "classes": []}
+        )
+
+        dataset = Dataset("test_dataset", project_path=mock_project_path)
+
+        with patch.object(Dataset, 'reload') as mock_reload:
+            dataset.add_class("cat")
+            dataset.add_class("dog")
+            dataset.add_class("fish", class_id=4)
+            dataset.rename_class("cat", "feline")
+            dataset.remove_class("dog")
+
+            mock_reload.assert_not_called()
+
+        assert dataset._data["classes"] == dataset.list_classes() == ["feline", "fish"]
+        assert dataset._data["num_classes"] == 2
+
+    def test_dataset_list_reads_registry_once(self, mock_project_path):
+        """Test Dataset.list() hydrates every dataset from a single registry read."""
+        with patch('modelcub.sdk.dataset.DatasetRegistry') as mock_cls:
+            registry = mock_cls.return_value
+            registry.list_datasets.return_value = [
+                {"name": "ds-a", "num_images": 3},
+                {"name": "ds-b", "status": "unlabeled"},
+            ]
+
+            datasets = Dataset.list(project_path=mock_project_path)
+
+            assert [d.name for d in datasets] == ["ds-a", "ds-b"]
+            assert datasets[0].images == 3
+            assert datasets[1].status == "unlabeled"
+            assert datasets[1].path == mock_project_path.resolve() / "data" / "datasets" / "ds-b"
+            mock_cls.assert_called_once()
+            registry.get_dataset.assert_not_called()
+
+    def test_dataset_exists_checks_manifest(self, mock_project_path, mock_dataset_registry):
+        """Test Dataset.exists() uses the manifest file without touching the registry."""
+        dataset_path = mock_project_path / "data" / "datasets" / "test_dataset"
+        dataset_path.mkdir(parents=True)
+
+        assert Dataset.exists("test_dataset", project_path=mock_project_path) is False
+
+        (dataset_path / "manifest.json").write_text("{}")
+
+        assert Dataset.exists("test_dataset", project_path=mock_project_path) is True
+        mock_dataset_registry.exists.assert_not_called()
+
+    def test_dataset_exists_strict_uses_registry(self, mock_project_path, mock_dataset_registry):
+        """Test Dataset.exists(strict=True) defers to the dataset registry."""
+        mock_dataset_registry.exists.return_value = True
+
+        assert Dataset.exists("test_dataset", project_path=mock_project_path, strict=True) is True
+        mock_dataset_registry.exists.assert_called_once_with("test_dataset")
+
     def test_dataset_info_method(self, mock_project_path, mock_dataset_registry):
         """Test Dataset.info() returns DatasetInfo."""
         mock_dataset_registry.get_dataset.return_value = {
@@ -353,6 +750,21 @@ class TestDataset:
         # Test that info method exists (implementation may vary)
         assert hasattr(dataset, 'info')
 
+    def test_dataset_info_reads_classes_from_cached_metadata(self, mock_project_path, mock_dataset_registry):
+        """Test Dataset.info() takes classes from loaded metadata without a registry query."""
+        mock_dataset_registry.get_dataset.return_value = {
+            "name": "test_dataset",
+            "num_images": 3,
+            "classes": ["cat", "dog"]
+        }
+
+        dataset = Dataset("test_dataset", project_path=mock_project_path)
+        info = dataset.info()
+
+        assert info.classes == ["cat", "dog"]
+        assert info.total_images == 3
+        mock_dataset_registry.list_classes.assert_not_called()
+
     def test_dataset_size_calculation(self, mock_project_path, mock_dataset_registry):
         """Test Dataset.size property calculates directory size."""
         mock_dataset_registry.get_dataset.return_value = {"name": "test_dataset"}
@@ -370,6 +782,187 @@ class TestDataset:
         # Size should be calculated
         assert hasattr(dataset, 'size')
 
+    def test_dataset_size_cached_until_tree_changes(self, mock_project_path, mock_dataset_registry):
+        """Test Dataset.size skips the walk while the tree is unchanged and recomputes after a change."""
+        mock_dataset_registry.get_dataset.return_value = {"name": "test_dataset"}
+
+        images_dir = mock_project_path / "data" / "datasets" / "test_dataset" / "train" / "images"
+        images_dir.mkdir(parents=True)
+        (images_dir / "image1.jpg").write_bytes(b"x" * 1024)
+
+        dataset = Dataset("test_dataset", project_path=mock_project_path)
+        assert dataset.size == "1.0 KB"
+
+        with patch('modelcub.sdk.dataset._dir_size') as mock_walk:
+            assert dataset.size == "1.0 KB"
+            mock_walk.assert_not_called()
+
+        (images_dir / "image2.jpg").write_bytes(b"x" * 1024)
+        # Bump the mtime explicitly; coarse filesystem clocks may not tick between writes
+        mtime_ns = images_dir.stat().st_mtime_ns + 1_000_000
+        os.utime(images_dir, ns=(mtime_ns, mtime_ns))
+
+        assert dataset.size == "2.0 KB"
+
+    def test_dataset_info_size_includes_nested_files(self, mock_project_path, mock_dataset_registry):
+        """Test Dataset.info() sums file sizes across nested split directories."""
+        mock_dataset_registry.get_dataset.return_value = {"name": "test_dataset"}
+        mock_dataset_registry.list_classes.return_value = []
+
+        dataset_path = mock_project_path / "data" / "datasets" / "test_dataset"
+        (dataset_path / "train" / "images").mkdir(parents=True)
+        (dataset_path / "val" / "images").mkdir(parents=True)
+        (dataset_path / "train" / "images" / "a.jpg").write_bytes(b"x" * 1024)
+        (dataset_path / "val" / "images" / "b.jpg").write_bytes(b"x" * 1024)
+
+        dataset = Dataset("test_dataset", project_path=mock_project_path)
+
+        assert dataset.info().size == "2.0 KB"
+
+    def test_dataset_size_follows_symlinked_images(self, mock_project_path, mock_dataset_registry):
+        """Test Dataset.size counts symlinked images (copy=False imports) by target size."""
+        mock_dataset_registry.get_dataset.return_value = {"name": "test_dataset"}
+
+        source = mock_project_path / "source.jpg"
+        source.write_bytes(b"x" * 2048)
+        images_dir = mock_project_path / "data" / "datasets" / "test_dataset" / "unlabeled" / "images"
+        images_dir.mkdir(parents=True)
+        (images_dir / "linked.jpg").symlink_to(source)
+        (images_dir / "dangling.jpg").symlink_to(mock_project_path / "missing.jpg")
+
+        dataset = Dataset("test_dataset", project_path=mock_project_path)
+
+        assert dataset.size == "2.0 KB"
+
+    def test_dataset_delete_moves_directory_out_before_removal(self, mock_project_path, mock_dataset_registry):
+        """Test delete() unlinks the dataset path immediately and clears the trash in the background."""
+        import time
+        mock_dataset_registry.get_dataset.return_value = {"name": "test_dataset"}
+        images_dir = mock_project_path / "data" / "datasets" / "test_dataset" / "train" / "images"
+        images_dir.mkdir(parents=True)
+        (images_dir / "a.jpg").write_bytes(b"x")
+
+        dataset = Dataset("test_dataset", project_path=mock_project_path)
+        dataset.delete(confirm=True, background=True)
+
+        assert not dataset.path.exists()
+        mock_dataset_registry.remove_dataset.assert_called_once_with("test_dataset")
+
+        trash_dir = mock_project_path / ".modelcub" / "trash"
+        deadline = time.time() + 5
+        while trash_dir.exists() and time.time() < deadline:
+            time.sleep(0.01)
+        assert not trash_dir.exists()
+
+    def test_dataset_delete_is_synchronous_by_default(self, mock_project_path, mock_dataset_registry):
+        """Test delete() removes the directory in place unless background=True."""
+        mock_dataset_registry.get_dataset.return_value = {"name": "test_dataset"}
+        images_dir = mock_project_path / "data" / "datasets" / "test_dataset" / "train" / "images"
+        images_dir.mkdir(parents=True)
+        (images_dir / "a.jpg").write_bytes(b"x")
+
+        Dataset("test_dataset", project_path=mock_project_path).delete(confirm=True)
+
+        assert not images_dir.parent.parent.exists()
+        assert not (mock_project_path / ".modelcub" / "trash").exists()
+
+    def test_background_delete_finishes_before_exit(self, temp_dir):
+        """Test a process that exits right after a background delete doesn't leave the tree in trash."""
+        import subprocess
+        import sys
+
+        tree = temp_dir / "big"
+        for i in range(200):
+            (tree / f"d{i}").mkdir(parents=True)
+            (tree / f"d{i}" / "f.bin").write_bytes(b"x" * 1024)
+        trash_dir = temp_dir / "trash"
+
+        script = (
+            "import sys; from pathlib import Path;"
+            "from modelcub.core.io_utils import delete_tree_in_background;"
+            "delete_tree_in_background(Path(sys.argv[1]), Path(sys.argv[2]))"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        subprocess.run([sys.executable, "-c", script, str(tree), str(trash_dir)], check=True, env=env)
+
+        assert not tree.exists()
+        assert not trash_dir.exists()
+
+    def test_trash_leftovers_swept_on_open(self, mock_project_path):
+        """Test opening a Project reaps entries an earlier process left in .modelcub/trash."""
+        from modelcub.core import io_utils
+
+        leftover = mock_project_path / ".modelcub" / "trash" / "old-dataset-1234abcd"
+        (leftover / "images").mkdir(parents=True)
+
+        with patch.object(io_utils, "_SWEPT_TRASH", set()):
+            Project(mock_project_path)
+            io_utils._join_pending_deletes()
+
+        assert not leftover.exists()
+
+    def test_dataset_iter_images_yields_batches(self, mock_project_path, mock_dataset_registry):
+        """Test iter_images() groups the registry stream into batches of batch_size."""
+        mock_dataset_registry.get_dataset.return_value = {"name": "test_dataset"}
+        mock_dataset_registry.iter_images.return_value = iter([{"name": f"{i}.jpg"} for i in range(5)])
+
+        dataset = Dataset("test_dataset", project_path=mock_project_path)
+        batches = list(dataset.iter_images(split="train", batch_size=2))
+
+        assert [len(b) for b in batches] == [2, 2, 1]
+        mock_dataset_registry.iter_images.assert_called_once_with("test_dataset", "train")
+
+    def test_format_size_unit_boundaries(self):
+        """Test _format_size picks the same units as the loop it replaced."""
+        from modelcub.sdk.dataset import _format_size
+
+        assert _format_size(0) == "0.0 B"
+        assert _format_size(1023) == "1023.0 B"
+        assert _format_size(1024) == "1.0 KB"
+        assert _format_size(3 * 1024 ** 2) == "3.0 MB"
+        assert _format_size(2048 * 1024 ** 4) == "2048.0 TB"
+
+    def test_dataset_get_split_counts_only_counts_images(self, mock_project_path, mock_dataset_registry):
+        """Test get_split_counts() ignores non-image files and missing splits."""
+        mock_dataset_registry.get_dataset.return_value = {"name": "test_dataset"}
+
+        train_dir = mock_project_path / "data" / "datasets" / "test_dataset" / "train" / "images"
+        train_dir.mkdir(parents=True)
+        (train_dir / "a.jpg").write_bytes(b"x")
+        (train_dir / "b.PNG").write_bytes(b"x")
+        (train_dir / "notes.txt").write_bytes(b"x")
+        (train_dir / "nested").mkdir()
+
+        dataset = Dataset("test_dataset", project_path=mock_project_path)
+
+        assert dataset.get_split_counts() == {"train": 2, "val": 0, "test": 0, "unlabeled": 0}
+
+
+class TestDatasetAnnotations:
+    """Test suite for Dataset annotation writes against a real dataset tree."""
+
+    def test_save_annotations_writes_labels_in_one_call(self, mock_project_path, mock_dataset_registry):
+        """Test save_annotations() writes each image's labels next to its split and reports misses."""
+        mock_dataset_registry.get_dataset.return_value = {"name": "test_dataset"}
+        dataset_path = mock_project_path / "data" / "datasets" / "test_dataset"
+        (dataset_path / "train" / "images").mkdir(parents=True)
+        (dataset_path / "unlabeled" / "images").mkdir(parents=True)
+        (dataset_path / "train" / "images" / "a.jpg").write_bytes(b"x")
+        (dataset_path / "unlabeled" / "images" / "b.png").write_bytes(b"x")
+
+        dataset = Dataset("test_dataset", project_path=mock_project_path)
+        result = dataset.save_annotations({
+            "a": [Box(class_id=0, x=0.5, y=0.5, w=0.2, h=0.2)],
+            "b": [],
+            "missing": [Box(class_id=1, x=0.1, y=0.1, w=0.1, h=0.1)],
+        })
+
+        assert result["success"] == ["a", "b"]
+        assert [f["image_id"] for f in result["failed"]] == ["missing"]
+        assert result["num_boxes"] == 1
+        assert (dataset_path / "train" / "labels" / "a.txt").read_text() == "0 0.500000 0.500000 0.200000 0.200000\n"
+        assert (dataset_path / "unlabeled" / "labels" / "b.txt").read_text() == ""
+
 
 class TestDatasetInfo:
     """Test suite for DatasetInfo dataclass."""
@@ -456,6 +1049,20 @@ class TestBox:
         assert 0 <= box.w <= 1
         assert 0 <= box.h <= 1
 
+    def test_save_annotation_passes_boxes_through(self, mock_project_path, mock_dataset_registry):
+        """Test save_annotation() hands Box instances to the service without copying them."""
+        mock_dataset_registry.get_dataset.return_value = {"name": "test_dataset"}
+        dataset = Dataset("test_dataset", project_path=mock_project_path)
+        box = Box(class_id=0, x=0.5, y=0.5, w=0.2, h=0.3)
+
+        with patch('modelcub.services.annotation_service.save_annotation') as mock_save:
+            mock_save.return_value = MagicMock(success=True, data={"num_boxes": 1})
+            dataset.save_annotation("img_001", [box])
+
+        req = mock_save.call_args[0][0]
+        assert req.boxes[0] is box
+        assert box.to_yolo_line() == "0 0.500000 0.500000 0.200000 0.300000"
+
 
 # ============================================================================
 # JOB TESTS
@@ -575,6 +1182,18 @@ class TestJob:
         assert result == job
         assert mock_manager.get_job.call_count >= 2
 
+    def test_job_wait_backs_off_exponentially(self, mock_job_data):
+        """Test Job.wait() grows the poll interval up to max_interval."""
+        mock_manager = MagicMock()
+        mock_manager.get_job.side_effect = [MagicMock(is_terminal=False)] * 5 + [MagicMock(is_terminal=True)]
+
+        job = Job(mock_job_data, mock_manager)
+
+        with patch('time.sleep') as mock_sleep:
+            job.wait(poll_interval=1.0, max_interval=3.0)
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 1.5, 2.25, 3.0, 3.0, 3.0]
+
     def test_job_get_tasks(self, mock_job_data):
         """Test Job.get_tasks() method."""
         mock_manager = MagicMock()
@@ -882,6 +1501,625 @@ class TestJobManager:
                 assert str(project_path) in repr_str
 
 
+# ============================================================================
+# TRAINING MANAGER TESTS
+# ============================================================================
+
+class TestTrainingManager:
+    """Test suite for TrainingManager and TrainingRun."""
+
+    def test_runs_share_the_manager_service(self, mock_project_path):
+        """Test the manager builds one TrainingService and its runs reuse it for polling."""
+        with patch('modelcub.services.training.training_service.TrainingService') as mock_service_cls:
+            service = mock_service_cls.return_value
+            service.project_root = mock_project_path
+            service.list_runs.return_value = [{"id": "run-1"}, {"id": "run-2"}]
+            service.get_status.return_value = {"status": "running", "config": {"model": "yolov8n"}}
+
+            manager = TrainingManager(mock_project_path)
+            runs = manager.list()
+            run = manager.get("run-1")
+            run.reload()
+            run.stop()
+
+        assert mock_service_cls.call_count == 1
+        assert [r.run_id for r in runs] == ["run-1", "run-2"]
+        service.stop_run.assert_called_once_with("run-1", timeout=10.0)
+        assert service.get_status.call_count == 3
+
+
+    def test_list_seeds_runs_from_listing(self, mock_project_path):
+        """Test list() reuses the listed entries and only re-checks running runs."""
+        with patch('modelcub.services.training.training_service.TrainingService') as mock_service_cls:
+            service = mock_service_cls.return_value
+            service.project_root = mock_project_path
+            service.list_runs.return_value = [
+                {"id": "run-1", "status": "completed", "config": {"model": "yolov8n"}},
+                {"id": "run-2", "status": "running", "config": {"model": "yolov8s"}},
+            ]
+            service.get_status.return_value = {"id": "run-2", "status": "failed", "config": {"model": "yolov8s"}}
+
+            runs = TrainingManager(mock_project_path).list()
+
+        service.get_status.assert_called_once_with("run-2")
+        assert [r.status for r in runs] == ["completed", "failed"]
+
+    def test_purge_removes_runs_in_one_registry_write(self, mock_project_path):
+        """Test purge() deletes every run's artifacts and removes the runs with one call."""
+        for run_id in ("run-1", "run-2"):
+            (mock_project_path / "runs" / run_id / "weights").mkdir(parents=True)
+
+        with patch('modelcub.services.training.training_service.TrainingService') as mock_service_cls:
+            service = mock_service_cls.return_value
+            service.project_root = mock_project_path
+            service.list_runs.return_value = [
+                {"id": run_id, "status": "completed", "artifacts_path": f"runs/{run_id}"}
+                for run_id in ("run-1", "run-2", "run-3")
+            ]
+
+            assert TrainingManager(mock_project_path).purge() == 3
+
+        service.run_registry.remove_runs.assert_called_once_with(["run-1", "run-2", "run-3"])
+        service.run_registry.remove_run.assert_not_called()
+        assert not (mock_project_path / "runs" / "run-1").exists()
+        assert not (mock_project_path / "runs" / "run-2").exists()
+
+    def test_derived_fields_cached_until_reload(self, mock_project_path):
+        """Test metrics/artifacts_path are built once per load and TrainingRun has no instance __dict__."""
+        with patch('modelcub.services.training.training_service.TrainingService') as mock_service_cls:
+            service = mock_service_cls.return_value
+            service.project_root = mock_project_path
+            service.get_status.side_effect = [
+                {"status": "completed", "metrics": {"map50": 0.5}, "artifacts_path": "runs/a"},
+                {"status": "completed", "metrics": {"map50": 0.7}, "artifacts_path": "runs/b"},
+            ]
+
+            run = TrainingManager(mock_project_path).get("run-1")
+            assert run.metrics is run.metrics
+            assert run.metrics.map50 == 0.5
+            with pytest.raises(dataclasses.FrozenInstanceError):
+                run.metrics.map50 = 1.0
+            assert run.metrics.map50 == 0.5
+            assert run.artifacts_path is run.artifacts_path
+
+            run.reload()
+            assert run.metrics.map50 == 0.7
+            assert run.artifacts_path == mock_project_path / "runs" / "b"
+
+        assert not hasattr(run, "__dict__")
+
+    def test_to_dict_copy_semantics(self, mock_project_path):
+        """Test to_dict() is a deep copy and to_dict(copy=False) a read-only view."""
+        with patch('modelcub.services.training.training_service.TrainingService') as mock_service_cls:
+            service = mock_service_cls.return_value
+            service.project_root = mock_project_path
+            service.get_status.return_value = {"status": "completed", "config": {"model": "yolov8n"}}
+
+            run = TrainingManager(mock_project_path).get("run-1")
+
+        data = run.to_dict()
+        data["config"]["model"] = "changed"
+        assert run.model == "yolov8n"
+
+        view = run.to_dict(copy=False)
+        assert view["status"] == "completed"
+        with pytest.raises(TypeError):
+            view["status"] = "failed"
+
+    def test_wait_backs_off_while_status_unchanged(self, mock_project_path):
+        """Test the polling wait() grows its interval up to 8x and resets it on a status change."""
+        import builtins
+
+        statuses = ["pending", "running", "running", "running", "running", "running", "running", "completed"]
+        real_import = builtins.__import__
+
+        def no_watchfiles(name, *args, **kwargs):
+            if name == "watchfiles":
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        with patch('modelcub.services.training.training_service.TrainingService') as mock_service_cls, \
+                patch('builtins.__import__', side_effect=no_watchfiles), \
+                patch('modelcub.sdk.training_run.time.sleep') as mock_sleep:
+            service = mock_service_cls.return_value
+            service.project_root = mock_project_path
+            service.get_status.side_effect = [{"status": status} for status in statuses]
+
+            run = TrainingManager(mock_project_path).get("run-1")
+            assert run.wait(poll_interval=1.0) == "completed"
+
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == [1.0, 1.0, 1.5, 2.25, 3.375, 5.0625, 7.59375]
+
+    def test_wait_wakes_on_registry_changes(self, mock_project_path):
+        """Test wait() reloads on watchfiles events instead of sleeping between polls."""
+        import sys
+        import types
+
+        calls = {}
+
+        def fake_watch(path, watch_filter, recursive, debounce, rust_timeout, yield_on_timeout):
+            calls.update(
+                path=path, recursive=recursive, debounce=debounce, timeout=rust_timeout,
+                matches=watch_filter(None, str(path / "runs.yaml"))
+            )
+            while True:
+                yield {("modified", str(path / "runs.yaml"))}
+
+        with patch('modelcub.services.training.training_service.TrainingService') as mock_service_cls, \
+                patch.dict(sys.modules, {"watchfiles": types.SimpleNamespace(watch=fake_watch)}), \
+                patch('modelcub.sdk.training_run.time.sleep') as mock_sleep:
+            service = mock_service_cls.return_value
+            service.project_root = mock_project_path
+            service.run_registry.registry_path = mock_project_path / ".modelcub" / "runs.yaml"
+            service.get_status.side_effect = [{"status": "running"}, {"status": "running"}, {"status": "completed"}]
+
+            run = TrainingManager(mock_project_path).get("run-1")
+            assert run.wait(poll_interval=2.0) == "completed"
+
+        mock_sleep.assert_not_called()
+        assert calls == {
+            "path": mock_project_path / ".modelcub", "recursive": False, "debounce": 50,
+            "timeout": 2000, "matches": True
+        }
+
+
+    def test_get_logs_reads_only_the_tail(self, mock_project_path):
+        """Test get_logs(lines=N) matches readlines() via both the chunked and the mmap tail."""
+        log_file = mock_project_path / "runs" / "run-1" / "logs" / "stdout.log"
+        log_file.parent.mkdir(parents=True)
+        log_file.write_bytes(b"".join(b"epoch %d\r\n" % i if i % 3 else b"epoch %d\n" % i for i in range(500)))
+
+        with patch('modelcub.services.training.training_service.TrainingService') as mock_service_cls, \
+                patch('modelcub.sdk.training_run._TAIL_CHUNK', 16):
+            service = mock_service_cls.return_value
+            service.project_root = mock_project_path
+            service.get_status.return_value = {"status": "completed", "artifacts_path": "runs/run-1"}
+
+            run = TrainingManager(mock_project_path).get("run-1")
+            with open(log_file) as f:
+                expected = f.readlines()
+
+            assert run.get_logs(lines=5) == expected[-5:]
+            assert run.get_logs(lines=1000) == expected
+            assert run.get_logs() == expected
+
+            with patch('modelcub.sdk.training_run._MMAP_MIN', 0):
+                assert run.get_logs(lines=5) == expected[-5:]
+                assert run.get_logs(lines=1000) == expected
+
+
+    def test_get_logs_follow_streams_until_run_finishes(self, mock_project_path):
+        """Test get_logs(follow=True) yields the tail, then appended lines, and stops with the run."""
+        log_file = mock_project_path / "runs" / "run-1" / "logs" / "stdout.log"
+        log_file.parent.mkdir(parents=True)
+        log_file.write_text("epoch 1\nepoch 2\n")
+
+        def append_line(_):
+            if mock_sleep.call_count == 1:
+                with open(log_file, "a") as f:
+                    f.write("epoch 3\n")
+
+        with patch('modelcub.services.training.training_service.TrainingService') as mock_service_cls, \
+                patch('modelcub.sdk.training_run.time.sleep', side_effect=append_line) as mock_sleep:
+            service = mock_service_cls.return_value
+            service.project_root = mock_project_path
+            service.get_status.side_effect = [
+                {"status": "running", "artifacts_path": "runs/run-1"},
+                {"status": "running", "artifacts_path": "runs/run-1"},
+                {"status": "completed", "artifacts_path": "runs/run-1"},
+            ]
+
+            run = TrainingManager(mock_project_path).get("run-1")
+            followed = list(run.get_logs(lines=1, follow=True))
+
+        assert followed == ["epoch 2\n", "epoch 3\n"]
+        assert service.get_status.call_count == 3
+
+
+# ============================================================================
+# MODEL MANAGER TESTS
+# ============================================================================
+
+@pytest.fixture
+def models_project(mock_project_path):
+    """Project with two promoted models in models.yaml."""
+    import yaml
+    models = {
+        name: {
+            "name": name, "version": "20250101-000000", "created": "2025-01-01T00:00:00Z",
+            "run_id": "run-1", "path": f"models/{name}/best.pt", "metadata": {}
+        }
+        for name in ("detector-v1", "detector-v2")
+    }
+    with open(mock_project_path / ".modelcub" / "models.yaml", "w") as f:
+        yaml.safe_dump({"models": models}, f)
+    return mock_project_path
+
+
+class TestModelManager:
+    """Test suite for ModelManager class."""
+
+    def test_list_hydrates_models_from_one_registry_read(self, models_project):
+        """Test list() builds PromotedModels from the listed entries without per-model lookups."""
+        manager = ModelManager(models_project)
+
+        with patch('modelcub.core.registries.ModelRegistry.get_model') as mock_get:
+            models = manager.list()
+            mock_get.assert_not_called()
+
+        assert [m.name for m in models] == ["detector-v1", "detector-v2"]
+        assert models[0].version == "20250101-000000"
+
+    def test_promote_records_weights_stat(self, models_project):
+        """Test promote() stats best.pt once and stores its size in the model metadata."""
+        weights = models_project / "runs" / "run-2" / "train" / "weights" / "best.pt"
+        weights.parent.mkdir(parents=True)
+        weights.write_bytes(b"w" * 64)
+
+        manager = ModelManager(models_project)
+        manager._run_registry = MagicMock()
+        manager._run_registry.get_run.return_value = {
+            "status": "completed", "artifacts_path": "runs/run-2", "config": {},
+            "dataset_name": "ds", "dataset_snapshot_id": "snap-1", "metrics": {}
+        }
+
+        model = manager.promote("run-2", "detector-v3")
+
+        assert model.metadata["size_bytes"] == 64
+        assert model.metadata["mtime_ns"] == weights.stat().st_mtime_ns
+        assert model.path.read_bytes() == b"w" * 64
+
+    def test_remove_uses_confirm_callback_and_refuses_without_tty(self, models_project):
+        """Test remove() asks the callback, and never blocks on input() without a terminal."""
+        manager = ModelManager(models_project)
+
+        manager.remove("detector-v1", confirm=lambda name: False)
+        assert manager.exists("detector-v1")
+
+        with patch('sys.stdin') as mock_stdin:
+            mock_stdin.isatty.return_value = False
+            with pytest.raises(ValueError, match="force=True"):
+                manager.remove("detector-v1")
+
+        manager.remove("detector-v1", confirm=lambda name: name == "detector-v1")
+        assert not manager.exists("detector-v1")
+
+    def test_remove_many_removes_all_or_nothing(self, models_project):
+        """Test remove_many() validates every name before removing any."""
+        manager = ModelManager(models_project)
+
+        with pytest.raises(ValueError, match="missing"):
+            manager.remove_many(["detector-v1", "missing"], force=True)
+        assert len(manager) == 2
+
+        manager.remove_many(["detector-v1", "detector-v2"], force=True)
+        assert len(manager) == 0
+
+    def test_remove_many_confirms_with_the_name_list(self, models_project):
+        """Test remove_many() asks for confirmation by default and passes the names as a list."""
+        manager = ModelManager(models_project)
+
+        with patch('modelcub.sdk.model_manager.sys.stdin') as mock_stdin:
+            mock_stdin.isatty.return_value = False
+            with pytest.raises(ValueError, match="force=True"):
+                manager.remove_many(["detector-v1"])
+
+        seen = []
+        manager.remove_many(["detector-v1", "detector-v2"], confirm=lambda names: seen.append(names) or False)
+        assert seen == [["detector-v1", "detector-v2"]]
+        assert len(manager) == 2
+
+        manager.remove_many(["detector-v1"], confirm=lambda names: names == ["detector-v1"])
+        assert not manager.exists("detector-v1")
+
+    def test_remove_confirm_true_proceeds_like_force(self, models_project):
+        """Test confirm=True removes without prompting, for remove() and remove_many()."""
+        manager = ModelManager(models_project)
+
+        with patch('modelcub.sdk.model_manager.sys.stdin') as mock_stdin:
+            mock_stdin.isatty.return_value = False
+            manager.remove("detector-v1", confirm=True)
+            manager.remove_many(["detector-v2"], confirm=True)
+
+        assert len(manager) == 0
+
+    def test_len_and_repr_count_without_building_models(self, models_project):
+        """Test len() and repr() count registry entries instead of listing models."""
+        manager = ModelManager(models_project)
+
+        with patch.object(ModelManager, 'list') as mock_list:
+            assert len(manager) == 2
+            assert repr(manager) == "ModelManager(2 models)"
+            assert manager.exists("detector-v1")
+            mock_list.assert_not_called()
+
+
+class TestPromotedModel:
+    """Test suite for PromotedModel class."""
+
+    def test_predict_reuses_loaded_weights(self, models_project):
+        """Test predict calls load the weights once per device and share one service."""
+        model = ModelManager(models_project).get("detector-v1")
+
+        with patch('modelcub.services.inference.inference_yolo.YOLOInferenceAdapter') as mock_adapter_cls, \
+                patch('modelcub.services.inference.InferenceService') as mock_service_cls:
+            service = mock_service_cls.return_value
+            service.inference_registry.get_inference.return_value = {"output_path": "predictions/inf-1"}
+            service.run_inference.return_value = {"total_images": 1}
+
+            model.predict_image("a.jpg", device="cpu")
+            model.predict_images("imgs/", device="cpu")
+            assert mock_adapter_cls.call_count == 1
+            mock_adapter_cls.return_value.load_model.assert_called_once_with(model.path, device="cpu")
+            assert service.run_inference.call_args.kwargs["adapter"] is mock_adapter_cls.return_value
+
+            model.predict_image("a.jpg", device="cuda")
+            assert mock_adapter_cls.call_count == 2
+            assert mock_service_cls.call_count == 1
+
+            # reload() is a no-op while models.yaml is unchanged...
+            model.reload()
+            model.predict_image("a.jpg", device="cuda")
+            assert mock_adapter_cls.call_count == 2
+
+            # ...and drops the cached weights once it changes
+            registry_path = models_project / ".modelcub" / "models.yaml"
+            registry_path.write_text(registry_path.read_text() + "\n")
+            model.reload()
+            model.predict_image("a.jpg", device="cuda")
+            assert mock_adapter_cls.call_count == 3
+
+    def test_fields_refresh_on_reload(self, models_project):
+        """Test version/run_id/created/path are loaded from the entry and refreshed by reload()."""
+        import yaml
+
+        model = ModelManager(models_project).get("detector-v1")
+        assert model.run_id == "run-1"
+        assert model.path == models_project.resolve() / "models" / "detector-v1" / "best.pt"
+
+        registry_path = models_project / ".modelcub" / "models.yaml"
+        data = yaml.safe_load(registry_path.read_text())
+        data["models"]["detector-v1"].update(version="20250202-000000", path="models/detector-v1/v2.pt")
+        registry_path.write_text(yaml.safe_dump(data))
+        model.reload()
+
+        assert model.version == "20250202-000000"
+        assert model.path.name == "v2.pt"
+
+    def test_predict_image_in_memory_skips_job(self, models_project):
+        """Test predict_image without outputs predicts directly instead of creating a job."""
+        from modelcub.services.inference import Detection, ImagePrediction, BoundingBox as InfBox
+
+        model = ModelManager(models_project).get("detector-v1")
+        detection = Detection(class_id=0, class_name="cat", confidence=0.9, bbox=InfBox(0.5, 0.5, 0.1, 0.1))
+        prediction = ImagePrediction("a.jpg", 64, 64, [detection, detection], 12.5)
+
+        with patch('modelcub.services.inference.inference_yolo.YOLOInferenceAdapter') as mock_adapter_cls, \
+                patch('modelcub.services.inference.InferenceService') as mock_service_cls:
+            mock_adapter_cls.return_value.predict_image.return_value = prediction
+            result = model.predict_image("a.jpg", conf=0.5, save_txt=False)
+
+        mock_service_cls.assert_not_called()
+        assert mock_adapter_cls.return_value.predict_image.call_args.args[0] == models_project / "a.jpg"
+        assert result.inference_id is None and result.output_path is None
+        assert result.total_images == 1
+        assert result.total_detections == 2
+        assert result.avg_inference_time == 12.5
+        assert result.classes_detected == ["cat"]
+        assert result.detections == [detection, detection]
+
+    def test_predict_images_in_memory_batches_directory(self, models_project):
+        """Test predict_images without outputs sends the scanned images to predict_batch."""
+        from modelcub.services.inference import ImagePrediction
+
+        images_dir = models_project / "incoming"
+        images_dir.mkdir()
+        for name in ("b.JPG", "a.png", "notes.txt"):
+            (images_dir / name).write_bytes(b"x")
+
+        model = ModelManager(models_project).get("detector-v1")
+        with patch('modelcub.services.inference.inference_yolo.YOLOInferenceAdapter') as mock_adapter_cls, \
+                patch('modelcub.services.inference.InferenceService') as mock_service_cls:
+            adapter = mock_adapter_cls.return_value
+            adapter.predict_batch.side_effect = lambda image_paths, **kw: [
+                ImagePrediction(str(p), 8, 8, [], 4.0) for p in image_paths
+            ]
+            result = model.predict_images("incoming", batch_size=8, save_txt=False)
+
+        mock_service_cls.assert_not_called()
+        kwargs = adapter.predict_batch.call_args.kwargs
+        assert kwargs["image_paths"] == [images_dir / "a.png", images_dir / "b.JPG"]
+        assert kwargs["batch_size"] == 8
+        assert result.total_images == 2
+        assert result.total_detections == 0
+
+    def test_metadata_is_read_only_view(self, models_project):
+        """Test metadata exposes the registry entry without copying it."""
+        model = ModelManager(models_project).get("detector-v1")
+        model._metadata.update({"tags": ["prod"], "metrics": {"map50": 0.7}})
+
+        assert model.tags == ["prod"]
+        assert model.map50 == 0.7
+        assert model.metadata["tags"] == ["prod"]
+        with pytest.raises(TypeError):
+            model.metadata["tags"] = []
+        assert model.to_dict()["metadata"]["tags"] == ["prod"]
+        assert not hasattr(model, "__dict__")
+
+    def test_info_prints_summary(self, models_project, capsys):
+        """Test info() renders every populated section."""
+        model = ModelManager(models_project).get("detector-v1")
+        model._metadata.update({"tags": ["prod", "v1"], "metrics": {"map50": 0.7}, "dataset_name": "animals"})
+
+        model.info()
+
+        out = capsys.readouterr().out
+        assert out.startswith("Model: detector-v1\nVersion: 20250101-000000\n")
+        assert "Tags: prod, v1\n\nMetrics:\n  map50: 0.7\n\nDataset: animals\n" in out
+        assert "Description" not in out
+
+    def test_predict_defaults_to_detected_device(self, models_project):
+        """Test device=None loads on the detected default device and records it on the job."""
+        model = ModelManager(models_project).get("detector-v1")
+
+        with patch('modelcub.services.inference.inference_yolo.default_device', return_value="cuda:0"), \
+                patch('modelcub.services.inference.inference_yolo.YOLOInferenceAdapter') as mock_adapter_cls, \
+                patch('modelcub.services.inference.InferenceService') as mock_service_cls:
+            service = mock_service_cls.return_value
+            service.inference_registry.get_inference.return_value = {"output_path": "predictions/inf-1"}
+            service.run_inference.return_value = {}
+
+            model.predict_image("a.jpg")
+
+        mock_adapter_cls.return_value.load_model.assert_called_once_with(model.path, device="cuda:0")
+        assert service.create_inference_job.call_args.kwargs["device"] == "cuda:0"
+
+    def test_predict_dataset_uses_registered_path(self, models_project):
+        """Test predict_dataset resolves the dataset with one lookup and uses its recorded path."""
+        from modelcub.core.registries import DatasetRegistry
+
+        DatasetRegistry(models_project).add_dataset(
+            {"id": "ds-1", "name": "animals", "path": "data/datasets/animals-v2"}
+        )
+        model = ModelManager(models_project).get("detector-v1")
+
+        with patch('modelcub.services.inference.inference_yolo.YOLOInferenceAdapter'), \
+                patch('modelcub.services.inference.InferenceService') as mock_service_cls:
+            service = mock_service_cls.return_value
+            service.inference_registry.get_inference.return_value = {"output_path": "predictions/inf-1"}
+            service.run_inference.return_value = {}
+
+            model.predict_dataset("animals", device="cpu")
+            with pytest.raises(ValueError, match="Dataset not found: missing"):
+                model.predict_dataset("missing", device="cpu")
+
+        input_path = service.create_inference_job.call_args.kwargs["input_path"]
+        assert input_path == str(models_project.resolve() / "data" / "datasets" / "animals-v2")
+
+    def test_warmup_uses_cached_adapter(self, models_project):
+        """Test warmup() loads the weights once and runs the dummy passes on them."""
+        model = ModelManager(models_project).get("detector-v1")
+
+        with patch('modelcub.services.inference.inference_yolo.YOLOInferenceAdapter') as mock_adapter_cls:
+            model.warmup(imgsz=320, device="cpu", runs=3)
+            model.warmup(device="cpu")
+
+        assert mock_adapter_cls.call_count == 1
+        mock_adapter_cls.return_value.warmup.assert_any_call(imgsz=320, runs=3)
+
+    def test_predict_concurrent_uses_one_adapter_per_worker(self, models_project):
+        """Test predict_concurrent keeps results in order and gives each call its own shared adapters."""
+        from modelcub.services.inference import ImagePrediction
+
+        model = ModelManager(models_project).get("detector-v1")
+        workers = []
+
+        def make_worker():
+            adapter = Mock()
+            adapter.predict_image.side_effect = lambda path, **kwargs: ImagePrediction(str(path), 64, 64, [], 5.0)
+            workers.append(adapter)
+            return adapter
+
+        with patch('modelcub.services.inference.inference_yolo.YOLOInferenceAdapter') as mock_adapter_cls:
+            mock_adapter_cls.return_value.share.side_effect = make_worker
+            results = model.predict_concurrent(["a.jpg", "b.jpg", "c.jpg"], device="cpu", max_workers=2)
+            model.predict_concurrent(["d.jpg", "e.jpg"], device="cpu", max_workers=2)
+
+        # Weights are loaded once; each call shares them through fresh worker adapters
+        assert mock_adapter_cls.call_count == 1
+        assert len(workers) == 4
+        assert sum(w.predict_image.call_count for w in workers[:2]) == 3
+        assert sum(w.predict_image.call_count for w in workers[2:]) == 2
+        assert [r.total_images for r in results] == [1, 1, 1]
+        assert all(r.inference_id is None for r in results)
+        assert model.predict_concurrent([], device="cpu") == []
+
+    def test_yolo_adapter_share_reuses_network_with_own_predictor(self):
+        """Test share() shares the loaded network, gives the copy its own predictor, and fuses once."""
+        from modelcub.services.inference.inference_yolo import YOLOInferenceAdapter
+
+        class FakeYOLO:
+            def __init__(self):
+                self.model = object()
+                self.predictor = "primary-predictor"
+                self.fuse_calls = 0
+
+            def fuse(self):
+                self.fuse_calls += 1
+
+        adapter = YOLOInferenceAdapter()
+        adapter.model = FakeYOLO()
+        adapter._class_names = ["cat"]
+
+        first, second = adapter.share(), adapter.share()
+
+        assert first.model is not adapter.model and second.model is not first.model
+        assert first.model.model is adapter.model.model
+        assert first.model.predictor is None
+        assert adapter.model.predictor == "primary-predictor"
+        assert adapter.model.fuse_calls == 1
+        assert first.get_class_names() == ["cat"]
+
+    def test_specialize_binds_settings(self, models_project):
+        """Test specialize() loads the weights once and predicts with the bound settings."""
+        from modelcub.services.inference import ImagePrediction
+
+        model = ModelManager(models_project).get("detector-v1")
+
+        with patch('modelcub.services.inference.inference_yolo.YOLOInferenceAdapter') as mock_adapter_cls:
+            adapter = mock_adapter_cls.return_value
+            adapter.predict_image.return_value = ImagePrediction("f.jpg", 64, 64, [], 4.0)
+
+            predict = model.specialize(conf=0.6, device="cpu", classes=[0])
+            results = [predict("f.jpg") for _ in range(3)]
+
+        assert mock_adapter_cls.call_count == 1
+        adapter.predict_image.assert_called_with(
+            models_project.resolve() / "f.jpg", conf_threshold=0.6, iou_threshold=0.45, classes=[0]
+        )
+        assert results[0].total_images == 1
+        assert results[0].inference_id is None
+
+    def test_predict_batch_prefetches_next_batch(self, temp_dir):
+        """Test predict_batch feeds decoded frames and decodes the next batch ahead of the forward pass."""
+        from modelcub.services.inference.inference_yolo import YOLOInferenceAdapter
+
+        paths = []
+        for index in range(5):
+            path = temp_dir / f"img{index}.jpg"
+            path.write_bytes(b"")
+            paths.append(path)
+
+        import threading
+
+        next_batch_decoding = threading.Event()
+        sources = []
+
+        def fake_predict(source, **kwargs):
+            # the forward pass of batch 1 must be able to see batch 2 decoding
+            sources.append((list(source), next_batch_decoding.wait(timeout=5)))
+            result = Mock(orig_shape=(32, 48), boxes=None)
+            return [result] * len(source)
+
+        adapter = YOLOInferenceAdapter()
+        adapter.model = Mock(predict=Mock(side_effect=fake_predict))
+
+        def fake_read(path):
+            if path.name == "img2.jpg":
+                next_batch_decoding.set()
+            return f"frame:{path.name}"
+
+        with patch('modelcub.services.inference.inference_yolo._read_image', side_effect=fake_read):
+            predictions = adapter.predict_batch(paths, batch_size=2)
+
+        assert [p.image_path for p in predictions] == [str(p) for p in paths]
+        assert predictions[0].image_width == 48
+        assert sources[0][0] == ["frame:img0.jpg", "frame:img1.jpg"]
+        assert adapter.model.predict.call_args_list[0].kwargs["batch"] == 2
+        assert sources[0][1] is True
+
+
 # ============================================================================
 # INTEGRATION TESTS
 # ============================================================================
@@ -1158,7 +2396,7 @@ class TestEdgeCases:
 
             project = Project(mock_project_path)
 
-            assert project._config == minimal_config
+            assert project.config == minimal_config
 
     def test_box_to_dict_preserves_precision(self):
         """Test Box.to_dict() preserves floating point precision."""
@@ -104,6 +104,68 @@ def test_dataset_not_found(dataset_registry):
         dataset_registry.get_dataset("nonexistent")
 
 
+def test_class_update_rewrites_manifest(dataset_registry, temp_project):
+    """Test class changes are written through to manifest.json atomically."""
+    dataset_dir = temp_project / "data" / "datasets" / "test-dataset"
+    dataset_dir.mkdir()
+    (dataset_dir / "manifest.json").write_text(json.dumps({"id": "ds-001", "classes": []}))
+    dataset_registry.add_dataset({"id": "ds-001", "name": "test-dataset", "classes": []})
+
+    dataset_registry.add_class("test-dataset", "cat")
+    dataset_registry.rename_class("test-dataset", "cat", "feline")
+
+    manifest = json.loads((dataset_dir / "manifest.json").read_text())
+    assert manifest == {"id": "ds-001", "classes": ["feline"]}
+    assert not list(dataset_dir.glob(".manifest.json.*.tmp"))
+
+
+def test_get_dataset_reuses_parsed_registry(dataset_registry, temp_project):
+    """Test lookups reuse the parsed registry until datasets.yaml changes."""
+    from unittest.mock import patch
+    from modelcub.core.registries import DatasetRegistry, DatasetNotFoundError
+
+    dataset_registry.add_dataset({"id": "ds-001", "name": "a", "classes": ["cat"]})
+    dataset_registry.add_dataset({"id": "ds-002", "name": "b"})
+
+    with patch.object(dataset_registry, "_load_registry", wraps=dataset_registry._load_registry) as mock_load:
+        for _ in range(3):
+            assert dataset_registry.get_dataset("a")["name"] == "a"
+        assert [d["name"] for d in dataset_registry.get_datasets(["b", "a"])] == ["b", "a"]
+        assert mock_load.call_count == 1
+
+    # Returned entries are copies of the cached ones
+    dataset_registry.get_dataset("a")["classes"].append("dog")
+    assert dataset_registry.get_dataset("a")["classes"] == ["cat"]
+
+    # Writes through another instance are picked up
+    DatasetRegistry(temp_project).add_dataset({"id": "ds-003", "name": "c-with-longer-name"})
+    assert dataset_registry.exists("c-with-longer-name")
+
+    with pytest.raises(DatasetNotFoundError, match="missing"):
+        dataset_registry.get_datasets(["a", "missing"])
+
+
+def test_iter_images_scans_split_layout(dataset_registry, temp_project):
+    """Test iter_images yields images from <split>/images with label status."""
+    dataset_dir = temp_project / "data" / "datasets" / "test-dataset"
+    (dataset_dir / "train" / "images").mkdir(parents=True)
+    (dataset_dir / "train" / "labels").mkdir(parents=True)
+    (dataset_dir / "val" / "images").mkdir(parents=True)
+    (dataset_dir / "train" / "images" / "a.jpg").write_bytes(b"x" * 10)
+    (dataset_dir / "train" / "images" / "notes.txt").write_text("skip")
+    (dataset_dir / "train" / "labels" / "a.txt").write_text("0 0.5 0.5 0.1 0.1")
+    (dataset_dir / "val" / "images" / "b.png").write_bytes(b"x" * 20)
+
+    images = sorted(dataset_registry.iter_images("test-dataset"), key=lambda i: i["name"])
+
+    assert [(i["name"], i["split"], i["size"], i["has_label"]) for i in images] == [
+        ("a.jpg", "train", 10, True),
+        ("b.png", "val", 20, False),
+    ]
+    assert list(dataset_registry.iter_images("test-dataset", split="test")) == []
+    assert dataset_registry.get_images("test-dataset", limit=1)[1] == 2
+
+
 # ============================================================================
 # RunRegistry Tests - Basic Operations
 # ============================================================================
@@ -167,6 +229,40 @@ def test_remove_run(run_registry):
     assert run_registry.get_run("run-001") is None
 
 
+def test_get_run_reuses_parsed_registry(run_registry, temp_project):
+    """Test run lookups reuse the parsed registry until runs.yaml changes."""
+    from unittest.mock import patch
+    from modelcub.core.registries import RunRegistry
+
+    run_registry.add_run({"id": "run-001", "status": "running", "metrics": {}})
+
+    with patch.object(run_registry, "_load_registry", wraps=run_registry._load_registry) as mock_load:
+        for _ in range(3):
+            assert run_registry.get_run("run-001")["status"] == "running"
+        assert len(run_registry.list_runs()) == 1
+        assert mock_load.call_count == 1
+
+    # Returned entries are copies of the cached ones
+    run_registry.get_run("run-001")["metrics"]["map50"] = 1.0
+    assert run_registry.get_run("run-001")["metrics"] == {}
+
+    # Writes through another instance are picked up
+    RunRegistry(temp_project).update_run("run-001", {"status": "completed", "pid": None})
+    assert run_registry.get_run("run-001")["status"] == "completed"
+
+
+def test_remove_runs_single_write(run_registry):
+    """Test removing several runs at once, ignoring unknown IDs."""
+    for run_id in ("run-001", "run-002", "run-003"):
+        run_registry.add_run({"id": run_id, "status": "completed"})
+
+    stat_before = run_registry.registry_path.stat()
+    run_registry.remove_runs(["run-001", "run-003", "run-missing"])
+
+    assert run_registry.registry_path.stat().st_size < stat_before.st_size
+    assert [r["id"] for r in run_registry.list_runs()] == ["run-002"]
+
+
 # ============================================================================
 # RunRegistry Tests - State Validation
 # ============================================================================
@@ -407,6 +503,20 @@ def test_get_model(model_registry, temp_project):
     assert model_registry.get_model("nonexistent") is None
 
 
+def test_count_and_exists_model(model_registry, temp_project):
+    """Test counting models and checking existence without fetching records."""
+    model_file = temp_project / "runs" / "run-001" / "best.pt"
+    model_file.parent.mkdir(parents=True)
+    model_file.write_text("weights")
+
+    assert model_registry.count_models() == 0
+    model_registry.promote_model("detector-v1", "run-001", model_file)
+
+    assert model_registry.count_models() == 1
+    assert model_registry.exists_model("detector-v1") is True
+    assert model_registry.exists_model("nonexistent") is False
+
+
 def test_remove_model(model_registry, temp_project):
     """Test removing promoted model."""
     model_file = temp_project / "runs" / "run-001" / "best.pt"